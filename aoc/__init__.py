@@ -21,3 +21,22 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from aoc.runner import arun_all, run_all
+
+__all__ = (
+    "arun_all",
+    "run_all",
+)
+
+
+def __getattr__(name: str) -> Any:
+    # The runner is imported on first use, so importing a day stays fast
+    if name in __all__:
+        # Deferred on purpose, see above
+        from aoc import runner  # pylint: disable=import-outside-toplevel
+
+        return getattr(runner, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
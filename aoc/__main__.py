@@ -0,0 +1,162 @@
+"""
+MIT License
+
+Copyright (c) 2022 BobDotCom
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+import argparse
+import os
+import sys
+from collections.abc import Sequence
+
+from aoc.bench import CallRecord
+from aoc.utils import available_days, load_day
+
+
+def _title(value: str) -> int | str:
+    return int(value) if value.isdigit() else value
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    """Parse the command line arguments.
+
+    Parameters
+    ----------
+    argv: Sequence[str] | None
+        The arguments to parse. Defaults to :data:`sys.argv`.
+
+    Returns
+    -------
+    argparse.Namespace
+        The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc", description="Run advent of code solutions."
+    )
+    parser.add_argument(
+        "-d",
+        "--day",
+        type=int,
+        action="append",
+        help="a day to run, may be given multiple times (default: all days)",
+    )
+    parser.add_argument(
+        "-p",
+        "--part",
+        type=_title,
+        action="append",
+        help="a part to run, may be given multiple times (default: all parts)",
+    )
+    parser.add_argument(
+        "-i",
+        "--input-path",
+        default="inputs",
+        help="the input directory, relative to the aoc package (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-e",
+        "--example",
+        action="store_true",
+        help="use the example inputs in the examples subdirectory of the input path",
+    )
+    parser.add_argument(
+        "-c",
+        "--cache",
+        metavar="PATH",
+        help="a database file used to cache results between runs",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="DIR",
+        help="profile each part with cProfile, and write the stats to this directory",
+    )
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="trace memory allocations, and print the peak of each part",
+    )
+    args = parser.parse_args(argv)
+    days = available_days()
+    for day in args.day or ():
+        if day not in days:
+            parser.error(f"day {day} does not exist")
+    if args.part:
+        titles = {
+            title for day in args.day or days for title in load_day(day)._part_attrs
+        }
+        for title in args.part:
+            if title not in titles:
+                parser.error(f"part {title} does not exist")
+    if args.example:
+        args.input_path = os.path.join(args.input_path, "examples")
+    return args
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the command line interface.
+
+    Parameters
+    ----------
+    argv: Sequence[str] | None
+        The arguments to parse. Defaults to :data:`sys.argv`.
+
+    Returns
+    -------
+    int
+        The exit code, non-zero if any part failed.
+    """
+    args = parse_args(argv)
+    failed = False
+    cache = None
+    if args.cache is not None:
+        # Imported only when needed, to keep startup fast
+        from aoc.cache import ResultCache  # pylint: disable=import-outside-toplevel
+
+        cache = ResultCache(args.cache)
+    try:
+        for day in args.day or available_days():
+            instance = load_day(day)(args.input_path, cache)
+            for func in instance.parts():
+                if args.part and func.title not in args.part:
+                    continue
+                profile = None
+                if args.profile is not None:
+                    profile = os.path.join(
+                        args.profile, f"day{day}_part{func.title}.pstats"
+                    )
+                records: list[CallRecord] = []
+                try:
+                    result = func.call(profile, args.trace_memory, records.append)
+                except Exception as exc:  # pylint: disable=broad-except
+                    failed = True
+                    print(f"Day {day} part {func.title}: {type(exc).__name__}: {exc}")
+                    continue
+                stats = f"{records[0].elapsed * 1000:.3f} ms"
+                if args.trace_memory:
+                    stats += f", peak memory: {records[0].peak_memory} bytes"
+                print(f"Day {day} part {func.title}: {result} ({stats})")
+    finally:
+        if cache is not None:
+            cache.close()
+    return int(failed)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
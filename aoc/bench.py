@@ -0,0 +1,164 @@
+"""
+MIT License
+
+Copyright (c) 2022 BobDotCom
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+import json
+import math
+import statistics
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+__all__ = (
+    "BenchResult",
+    "CallRecord",
+    "Timings",
+    "dumps",
+)
+
+
+@dataclass(frozen=True)
+class Timings:
+    """A set of wall time samples, in seconds.
+
+    Attributes
+    ----------
+    samples: tuple[float, ...]
+        The raw samples, in the order they were taken.
+    """
+
+    samples: tuple[float, ...]
+
+    @property
+    def min(self) -> float:
+        """The fastest sample."""
+        return min(self.samples)
+
+    @property
+    def median(self) -> float:
+        """The median sample."""
+        return statistics.median(self.samples)
+
+    @property
+    def p95(self) -> float:
+        """The 95th percentile sample, using the nearest-rank method."""
+        ordered = sorted(self.samples)
+        return ordered[max(math.ceil(len(ordered) * 0.95) - 1, 0)]
+
+    def as_dict(self) -> dict[str, float]:
+        """Summarize the samples.
+
+        Returns
+        -------
+        dict[str, float]
+            The min, median and p95 of the samples.
+        """
+        return {"min": self.min, "median": self.median, "p95": self.p95}
+
+
+@dataclass(frozen=True)
+class BenchResult:
+    """The result of benchmarking a single part.
+
+    Attributes
+    ----------
+    day: int | str
+        The day of the challenge.
+    part: int | str
+        The title of the part.
+    load: Timings
+        The time spent loading the input.
+    solve: Timings
+        The time spent solving, excluding loading.
+    """
+
+    day: int | str
+    part: int | str
+    load: Timings
+    solve: Timings
+
+    def as_dict(self) -> dict[str, Any]:
+        """Convert the result to a JSON serializable dict.
+
+        Returns
+        -------
+        dict[str, Any]
+            The result.
+        """
+        return {
+            "day": self.day,
+            "part": self.part,
+            "repeat": len(self.solve.samples),
+            "load": self.load.as_dict(),
+            "solve": self.solve.as_dict(),
+        }
+
+
+@dataclass(frozen=True)
+class CallRecord:
+    """A single instrumented run of a part, see :meth:`aoc.utils.Part.call`.
+
+    Attributes
+    ----------
+    day: int | str
+        The day of the challenge.
+    part: int | str
+        The title of the part.
+    start: float
+        The :func:`time.perf_counter` value when the part started.
+    end: float
+        The :func:`time.perf_counter` value when the part finished.
+    result: Any
+        The return value of the part.
+    peak_memory: int | None
+        The peak memory allocated while running the part, in bytes, if it was traced.
+    """
+
+    day: int | str
+    part: int | str
+    start: float
+    end: float
+    result: Any
+    peak_memory: int | None = None
+
+    @property
+    def elapsed(self) -> float:
+        """The wall time spent running the part, in seconds."""
+        return self.end - self.start
+
+
+def dumps(results: Iterable[BenchResult], **kwargs: Any) -> str:
+    """Serialize benchmark results to JSON.
+
+    Parameters
+    ----------
+    results: Iterable[BenchResult]
+        The results to serialize.
+    **kwargs: Any
+        Passed to :func:`json.dumps`.
+
+    Returns
+    -------
+    str
+        The JSON document, a list with one object per part.
+    """
+    return json.dumps([result.as_dict() for result in results], **kwargs)
@@ -0,0 +1,204 @@
+"""
+MIT License
+
+Copyright (c) 2022 BobDotCom
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+import functools
+import hashlib
+import inspect
+import json
+import sqlite3
+import sys
+import threading
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from aoc.utils import Part
+
+__all__ = ("ResultCache",)
+
+_MISSING = object()
+
+
+@functools.cache
+def _source_digest(module_name: str) -> str:
+    module = sys.modules[module_name]
+    try:
+        source = inspect.getsource(module).encode()
+    except (OSError, TypeError):  # pragma: no cover
+        # No source available, so hash the compiled module instead
+        with open(str(module.__file__), "rb") as file:
+            source = file.read()
+    return hashlib.sha256(source).hexdigest()
+
+
+class ResultCache:
+    """A persistent cache of part results, stored in a SQLite database.
+
+    Results are keyed by the day, the part title, a hash of the input and a hash of
+    the source of the modules defining the part, so changing either the input or the
+    code invalidates the result. Only results that survive a round trip through JSON
+    are cached. When the cache is full, the least recently used results are evicted.
+
+    Attributes
+    ----------
+    path: str
+        The path to the database file.
+    max_entries: int
+        The maximum number of results to keep.
+    """
+
+    def __init__(self, path: str, max_entries: int = 1024) -> None:
+        """
+        Parameters
+        ----------
+        path: str
+            The path to the database file. It is created if it doesn't exist.
+        max_entries: int
+            The maximum number of results to keep.
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS results "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, used INTEGER NOT NULL)"
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            count: int = self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        return count
+
+    def key(self, func: "Part") -> str:
+        """Get the cache key for a part, based on its current input, its source and the
+        day's :meth:`~aoc.utils.Day.config`.
+
+        Parameters
+        ----------
+        func: Part
+            The part.
+
+        Returns
+        -------
+        str
+            The key.
+        """
+        modules = {func.func.__module__}
+        if func.parser is not None and not isinstance(func.parser, str):
+            modules.add(func.parser.__module__)
+        data = [
+            str(func.day.get_date()),
+            repr(func.title),
+            func.day.input_digest(func.title),
+            repr(sorted(func.day.config().items())),
+            *sorted(_source_digest(name) for name in modules),
+        ]
+        return hashlib.sha256("\0".join(data).encode()).hexdigest()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a cached result.
+
+        Parameters
+        ----------
+        key: str
+            The key, from :meth:`key`.
+        default: Any
+            Returned if the result isn't cached.
+
+        Returns
+        -------
+        Any
+            The result.
+        """
+        with self._lock, self._db:
+            row = self._db.execute(
+                "SELECT value FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return default
+            self._db.execute(
+                "UPDATE results SET used = ? WHERE key = ?", (time.time_ns(), key)
+            )
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any) -> None:
+        """Cache a result, evicting the least recently used results if the cache is
+        full. Results that can't be stored as JSON without changing are ignored.
+
+        Parameters
+        ----------
+        key: str
+            The key, from :meth:`key`.
+        value: Any
+            The result.
+        """
+        try:
+            encoded = json.dumps(value)
+        except (TypeError, ValueError):
+            return
+        if json.loads(encoded) != value:
+            return
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?)",
+                (key, encoded, time.time_ns()),
+            )
+            self._db.execute(
+                "DELETE FROM results WHERE key NOT IN "
+                "(SELECT key FROM results ORDER BY used DESC LIMIT ?)",
+                (self.max_entries,),
+            )
+
+    def get_or_call(self, func: "Part", call: Callable[[], Any]) -> Any:
+        """Get the cached result of a part, or compute and cache it.
+
+        Parameters
+        ----------
+        func: Part
+            The part.
+        call: Callable[[], Any]
+            Computes the result if it isn't cached.
+
+        Returns
+        -------
+        Any
+            The result.
+        """
+        key = self.key(func)
+        if (result := self.get(key, _MISSING)) is not _MISSING:
+            return result
+        result = call()
+        self.set(key, result)
+        return result
+
+    def clear(self) -> None:
+        """Remove all cached results."""
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM results")
+
+    def close(self) -> None:
+        """Close the database."""
+        self._db.close()
@@ -21,12 +21,21 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
+import functools
+import heapq
+import itertools
+import mmap
+import os
+import re
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
+
 from aoc.utils import Day, part
 
 __all__ = ("Day1",)
 
 
-def parse_input(value: str) -> list[int]:
+def parse_input(lines: Iterable[str]) -> list[int]:
     """Parse input into a list of ints. Takes the input in the form of integers on
     individual lines, separated into groups. Each group is separated by a blank line.
     The return value is a list of integers, where the items are the sum of the integers
@@ -34,15 +43,14 @@ def parse_input(value: str) -> list[int]:
 
     Parameters
     ----------
-    value: str
-        The input to parse.
+    lines: Iterable[str]
+        The lines of the input to parse.
 
     Returns
     -------
     list[int]
         The parsed input.
     """
-    lines = value.splitlines()
     values = [0]
     for line in lines:
         if line == "":
@@ -52,42 +60,244 @@ def parse_input(value: str) -> list[int]:
     return values
 
 
+def push_top(heap: list[int], value: int, k: int) -> None:
+    """Add a value to a min-heap of the ``k`` largest values seen, if it is one of
+    them.
+
+    Parameters
+    ----------
+    heap: list[int]
+        The heap.
+    value: int
+        The value to add.
+    k: int
+        The number of values to keep.
+    """
+    if len(heap) < k:
+        heapq.heappush(heap, value)
+    elif value > heap[0]:
+        heapq.heapreplace(heap, value)
+
+
+def top_k(lines: Iterable[str], k: int = 3) -> list[int]:
+    """Parse the input in a single pass, like :func:`parse_input`, but keep only the
+    ``k`` largest group sums. This takes O(n log k) time and O(k) memory.
+
+    Parameters
+    ----------
+    lines: Iterable[str]
+        The lines of the input to parse.
+    k: int
+        The number of group sums to keep.
+
+    Returns
+    -------
+    list[int]
+        The largest group sums, in descending order.
+    """
+    if k < 1:
+        raise ValueError("k must be at least 1")
+    heap: list[int] = []
+    total = 0
+    for line in lines:
+        if line == "":
+            push_top(heap, total, k)
+            total = 0
+        else:
+            total += int(line)
+    push_top(heap, total, k)
+    return sorted(heap, reverse=True)
+
+
+@functools.cache
+def top_parser(k: int) -> Callable[[Iterable[str]], list[int]]:
+    """Get a parser that runs :func:`top_k` with ``k``. The same parser is returned
+    for the same ``k``, so its result is cached with the input.
+
+    Parameters
+    ----------
+    k: int
+        The number of group sums to keep.
+
+    Returns
+    -------
+    Callable[[Iterable[str]], list[int]]
+        The parser.
+    """
+    return functools.partial(top_k, k=k)
+
+
+BLANK_LINE = re.compile(rb"\n\r?\n")
+
+
+def group_ranges(value: bytes | mmap.mmap, chunks: int) -> list[tuple[int, int]]:
+    """Split the input into at most ``chunks`` byte ranges of about the same size.
+    Every range but the last ends just after a blank line, so each group is entirely
+    in one range. A group larger than a chunk makes fewer, larger ranges.
+
+    Parameters
+    ----------
+    value: bytes | mmap.mmap
+        The input.
+    chunks: int
+        The number of ranges to aim for.
+
+    Returns
+    -------
+    list[tuple[int, int]]
+        The start and stop offsets of each range, in order.
+    """
+    size = len(value)
+    step = max(-(-size // chunks), 1)
+    ranges = []
+    start = 0
+    while True:
+        match = None
+        if start + step < size:
+            # Search from the line break before the target, so a blank line starting
+            # exactly at it is found too
+            match = BLANK_LINE.search(value, start + step - 1)
+        stop = size if match is None else match.end()
+        ranges.append((start, stop))
+        if stop == size:
+            return ranges
+        start = stop
+
+
+def _range_top(path: str, start: int, stop: int, k: int, last: bool) -> list[int]:
+    # Like top_k, over a range from group_ranges. The group after the range's final
+    # blank line belongs to the next range, unless this is the last one
+    heap: list[int] = []
+    total = 0
+    with open(path, "rb") as file:
+        file.seek(start)
+        position = start
+        for line in file:
+            if position >= stop:
+                break
+            position += len(line)
+            if line.strip():
+                total += int(line)
+            else:
+                push_top(heap, total, k)
+                total = 0
+    if last:
+        push_top(heap, total, k)
+    return heap
+
+
+def parallel_top_k(path: str, k: int = 3, workers: int | None = None) -> list[int]:
+    """Like :func:`top_k`, split across processes. The input file is split with
+    :func:`group_ranges`, and each worker reads its own range from the file and
+    returns the top ``k`` group sums in it, which are merged.
+
+    Parameters
+    ----------
+    path: str
+        The path to the input file.
+    k: int
+        The number of group sums to keep.
+    workers: int | None
+        The number of worker processes. Defaults to the number of CPUs.
+
+    Returns
+    -------
+    list[int]
+        The largest group sums, in descending order.
+    """
+    if k < 1:
+        raise ValueError("k must be at least 1")
+    workers = workers or os.cpu_count() or 1
+    with open(path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        if size == 0:
+            ranges = [(0, 0)]
+        else:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as value:
+                ranges = group_ranges(value, workers)
+    if len(ranges) == 1:
+        return sorted(_range_top(path, 0, size, k, True), reverse=True)
+    with ProcessPoolExecutor(min(workers, len(ranges))) as executor:
+        jobs = [
+            executor.submit(_range_top, path, start, stop, k, stop == size)
+            for start, stop in ranges
+        ]
+        results = [job.result() for job in jobs]
+    return heapq.nlargest(k, itertools.chain.from_iterable(results))
+
+
 class Day1(Day):
-    """Day 1: Calorie Counting"""
+    """Day 1: Calorie Counting
+
+    Attributes
+    ----------
+    k: int
+        The number of group sums returned by :meth:`top`.
+    workers: int | None
+        The number of processes :meth:`top` uses, via :func:`parallel_top_k`. If
+        ``None``, the number of CPUs is used.
+    """
+
+    k: int = 3
+    workers: int | None = 1
+
+    def top(self, title: int | str = 1) -> list[int]:
+        """Get the :attr:`k` largest group sums, in descending order. They are
+        cached with the input, and shared with the parts when :attr:`k` is 3 and
+        :attr:`workers` is 1.
+
+        Parameters
+        ----------
+        title: int | str
+            The title of the part whose input to use.
+
+        Returns
+        -------
+        list[int]
+            The largest group sums.
+        """
+        if self.workers == 1:
+            return self.get_parsed(title, top_parser(self.k), stream=True)
+        path, stat = self.find_input(title)
+        k, workers = self.k, self.workers
+        return self._cached(
+            (path, stat.st_mtime_ns, stat.st_size, parallel_top_k, k, workers),
+            lambda: parallel_top_k(path, k, workers),
+        )
 
-    @part(1)
-    def part_1(self, value: str) -> int:
-        """Part 1 of the challenge. Takes the input and parses it via :func:`parse_input`,
-        then returns the largest value in the list.
+    @part(1, parser=top_parser(3), stream=True)
+    def part_1(self, value: list[int]) -> int:
+        """Part 1 of the challenge. Takes the top 3 group sums via :func:`top_k`, then
+        returns the largest.
 
         Parameters
         ----------
-        value: str
-            The input to parse.
+        value: list[int]
+            The parsed input.
 
         Returns
         -------
         int
-            The largest value in the list.
+            The largest group sum.
         """
-        return max(parse_input(value))
+        return value[0]
 
-    @part(2)
-    def part_2(self, value: str) -> int:
+    @part(2, parser=top_parser(3), stream=True)
+    def part_2(self, value: list[int]) -> int:
         """Part 2 of the challenge. This is the same as part one, but it returns the sum
         of the top 3, instead of the top 1.
 
         Parameters
         ----------
-        value: str
-            The input to parse.
+        value: list[int]
+            The parsed input.
 
         Returns
         -------
         int
-            The sum of the top 3 values in the list.
+            The sum of the top 3 group sums.
         """
-        return sum(sorted(parse_input(value))[-3:])
+        return sum(value)
 
 
 if __name__ == "__main__":
@@ -21,21 +21,68 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
-from typing import Literal
+import mmap
 
 from aoc.utils import Day, part
 
 __all__ = ("Day2",)
 
+#: The 9 possible rounds, in the order of the score tables.
+PATTERNS = tuple(
+    bytes((opponent, ord(" "), response)) for opponent in b"ABC" for response in b"XYZ"
+)
+#: The score of each round, when the second column is our shape.
+SCORES_1 = tuple(
+    response + 1 + 3 * ((response - opponent + 1) % 3)
+    for opponent in range(3)
+    for response in range(3)
+)
+#: The score of each round, when the second column is the outcome.
+SCORES_2 = tuple(
+    (opponent + outcome - 1) % 3 + 1 + 3 * outcome
+    for opponent in range(3)
+    for outcome in range(3)
+)
+
+
+def count_rounds(value: bytes | mmap.mmap, chunk_size: int = 1 << 20) -> list[int]:
+    """Count how many times each of the 9 possible rounds is played. The input is
+    counted in chunks ending at a line break, so each round is counted once, and an
+    mmap is never copied whole.
 
-def logic(value: str, p2_logic: bool = False) -> int:
-    """Logic for both parts of the challenge. Takes the input and parses it, then
-    returns the result.
+    Parameters
+    ----------
+    value: bytes | mmap.mmap
+        The input.
+    chunk_size: int
+        The least number of bytes counted at once.
+
+    Returns
+    -------
+    list[int]
+        The number of each round, in the order of :data:`PATTERNS`.
+    """
+    counts = [0] * len(PATTERNS)
+    start = 0
+    while start < len(value):
+        end = value.find(b"\n", start + chunk_size)
+        if end == -1:
+            end = len(value)
+        chunk = value[start:end]
+        for index, pattern in enumerate(PATTERNS):
+            counts[index] += chunk.count(pattern)
+        start = end
+    return counts
+
+
+def logic(counts: list[int], p2_logic: bool = False) -> int:
+    """Logic for both parts of the challenge. Takes the parsed input and returns the
+    result.
 
     Parameters
     ----------
-    value: str
-        The input to parse.
+    counts: list[int]
+        The number of each round, from :func:`count_rounds`.
     p2_logic: bool
         Whether to use the logic for part 2 or not.
 
@@ -44,45 +91,20 @@ def logic(value: str, p2_logic: bool = False) -> int:
     int
         The result of the logic.
     """
-    rt = list[tuple[Literal["A", "B", "C"], Literal["X", "Y", "Z"]]]
-    # We know that our typehint is correct here, so we can use a type: ignore
-    rounds: rt = [tuple(val.split()) for val in value.splitlines()]  # type: ignore
-    total = 0
-    for r_val in rounds:
-        if p2_logic:
-            r_val = (  # type: ignore[assignment]
-                r_val[0],
-                "XYZ"[("ABC".index(r_val[0]) + "XYZ".index(r_val[1]) - 1) % 3],
-            )
-        if r_val in [("A", "X"), ("B", "Y"), ("C", "Z")]:
-            total += 3
-        match r_val[1]:
-            case "X":
-                total += 1
-                if r_val[0] == "C":
-                    total += 6
-            case "Y":
-                total += 2
-                if r_val[0] == "A":
-                    total += 6
-            case "Z":
-                total += 3
-                if r_val[0] == "B":
-                    total += 6
-    return total
+    return sum(map(int.__mul__, counts, SCORES_2 if p2_logic else SCORES_1))
 
 
 class Day2(Day):
     """Day 2: Rock Paper Scissors"""
 
-    @part(1)
-    def part_1(self, value: str) -> int:
+    @part(1, parser=count_rounds, buffer=True)
+    def part_1(self, value: list[int]) -> int:
         """Part 1
 
         Parameters
         ----------
-        value: str
-            The input to parse.
+        value: list[int]
+            The number of each round.
 
         Returns
         -------
@@ -91,14 +113,14 @@ class Day2(Day):
         """
         return logic(value)
 
-    @part(2)
-    def part_2(self, value: str) -> int:
+    @part(2, parser=count_rounds, buffer=True)
+    def part_2(self, value: list[int]) -> int:
         """Part 2
 
         Parameters
         ----------
-        value: str
-            The input to parse.
+        value: list[int]
+            The number of each round.
 
         Returns
         -------
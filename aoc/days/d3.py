@@ -21,15 +21,24 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
+import mmap
+import operator
 import string
 from collections.abc import Iterable, Iterator
+from functools import reduce
 from itertools import islice
-from typing import TypeVar
+from typing import Any, TypeVar
 
-from aoc.utils import Day, part
+from aoc.utils import Day, iter_lines, part
 
 V = TypeVar("V")
 
+# Maps each byte to the priority of its item, 0 for bytes that aren't items
+PRIORITIES = bytes(string.ascii_letters.find(char) + 1 for char in map(chr, range(256)))
+# Maps each byte to a mask with the bit for its item set. The bit of an item with
+# priority ``p`` is ``1 << (p - 1)``, so the priority is the mask's bit length.
+MASKS = [(1 << priority) >> 1 for priority in PRIORITIES]
+
 
 def batched(iterable: Iterable[V], size: int) -> Iterator[list[V]]:
     """Batch data into lists of length ``size``. The last batch may be shorter.
@@ -53,57 +62,158 @@ def batched(iterable: Iterable[V], size: int) -> Iterator[list[V]]:
         yield batch
 
 
+def common_items(first: bytes, second: bytes) -> bytes:
+    """Get the items of ``first`` that are also in ``second``. Both scans are done by
+    :meth:`bytes.translate`, in C.
+
+    Parameters
+    ----------
+    first: bytes
+        The first rucksack or compartment.
+    second: bytes
+        The second rucksack or compartment.
+
+    Returns
+    -------
+    bytes
+        The common items, as often as they are in ``first``.
+    """
+    # Deleting the items missing from second leaves the common ones
+    return first.translate(None, first.translate(None, second))
+
+
+def item_mask(items: bytes) -> int:
+    """Get the set of items in a rucksack or compartment, as a bitmask.
+
+    Parameters
+    ----------
+    items: bytes
+        The items.
+
+    Returns
+    -------
+    int
+        The bitmask, see :data:`MASKS`.
+    """
+    return reduce(operator.or_, map(MASKS.__getitem__, items), 0)
+
+
+def compartment_priorities(lines: Iterable[bytes], bitmask: bool = False) -> int:
+    """Sum the priorities of the items in both compartments of each rucksack.
+
+    Parameters
+    ----------
+    lines: Iterable[bytes]
+        The rucksacks.
+    bitmask: bool
+        Whether to compare the compartments as bitmasks, see :func:`item_mask`.
+        Otherwise, the first compartment is scanned for the first item in the second.
+
+    Returns
+    -------
+    int
+        The sum of the priorities.
+    """
+    total = 0
+    for line in lines:
+        half = len(line) // 2
+        if bitmask:
+            total += (item_mask(line[:half]) & item_mask(line[half:])).bit_length()
+            continue
+        second = line[half:]
+        for item in line[:half]:
+            if item in second:
+                total += PRIORITIES[item]
+                break
+    return total
+
+
+def group_priorities(lines: Iterable[bytes], size: int, bitmask: bool = False) -> int:
+    """Sum the priorities of the items in every rucksack of each group.
+
+    Parameters
+    ----------
+    lines: Iterable[bytes]
+        The rucksacks.
+    size: int
+        The number of rucksacks in a group.
+    bitmask: bool
+        Whether to compare the rucksacks as bitmasks, see :func:`item_mask`.
+        Otherwise, the first rucksack is scanned for the first item in the others.
+
+    Returns
+    -------
+    int
+        The sum of the priorities.
+    """
+    if bitmask:
+        return sum(
+            reduce(operator.and_, map(item_mask, group)).bit_length()
+            for group in batched(lines, size)
+        )
+    total = 0
+    for first, *rest in batched(lines, size):
+        # Narrow the first rucksack down, so that at most two others are scanned
+        while len(rest) > 2:
+            first = common_items(first, rest.pop())
+        second = rest[0] if rest else first
+        third = rest[1] if len(rest) > 1 else first
+        for item in first:
+            if item in second and item in third:
+                total += PRIORITIES[item]
+                break
+    return total
+
+
 class Day3(Day):
-    """Day 3: Rucksack Reorganization"""
+    """Day 3: Rucksack Reorganization
+
+    Attributes
+    ----------
+    group_size: int
+        The number of rucksacks in a group, for part 2.
+    bitmask: bool
+        Whether to find common items with bitmasks, see :func:`item_mask`. This is
+        slower than scanning, the default.
+    """
 
-    @part(1)
-    def part_1(self, value: str) -> int:
+    group_size: int = 3
+    bitmask: bool = False
+
+    def config(self) -> dict[str, Any]:
+        return {"group_size": self.group_size, "bitmask": self.bitmask}
+
+    @part(1, buffer=True)
+    def part_1(self, value: bytes | mmap.mmap) -> int:
         """Part 1 of the challenge.
 
         Parameters
         ----------
-        value: str
-            The input to parse.
+        value: bytes | mmap.mmap
+            The input.
 
         Returns
         -------
         int
             The answer to the challenge.
         """
-        total = 0
-
-        for line in value.splitlines():
-            comp1 = line[: len(line) // 2]
-            comp2 = line[len(line) // 2 :]
-            for letter in comp1:
-                if letter in comp2:
-                    total += string.ascii_letters.index(letter) + 1
-                    break
-        return total
-
-    @part(2)
-    def part_2(self, value: str) -> int:
+        return compartment_priorities(iter_lines(value), self.bitmask)
+
+    @part(2, buffer=True)
+    def part_2(self, value: bytes | mmap.mmap) -> int:
         """Part 2 of the challenge.
 
         Parameters
         ----------
-        value: str
-            The input to parse.
+        value: bytes | mmap.mmap
+            The input.
 
         Returns
         -------
         int
             The answer to the challenge.
         """
-        total = 0
-
-        for lines in batched(value.splitlines(), 3):
-            for letter in lines[0]:
-                if letter in lines[1] and letter in lines[2]:
-                    total += string.ascii_letters.index(letter) + 1
-                    break
-
-        return total
+        return group_priorities(iter_lines(value), self.group_size, self.bitmask)
 
 
 if __name__ == "__main__":
@@ -21,86 +21,242 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
+import heapq
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from collections.abc import Iterable, Iterator
+
 from aoc.utils import Day, part
 
 
-def parse_input(value: str) -> list[list[list[int]]]:
-    """Parses the input into groups.
+def parse_input(lines: Iterable[str]) -> "array[int]":
+    """Parses the input into a flat array of section bounds, one line at a time. Each
+    line ``a-b,c-d`` adds ``a, b, c, d``, so pair ``i`` is at ``[4 * i : 4 * i + 4]``.
 
     Parameters
     ----------
-    value: str
-        The input to parse.
+    lines: Iterable[str]
+        The lines of the input to parse.
 
     Returns
     -------
-    list[list[list[int]]]
+    array[int]
         The parsed input.
     """
-    return [
-        [
-            list(
-                range(
-                    int(x.split("-")[0]),
-                    int(x.split("-")[1]) + 1,
-                )
-            )
-            for x in group.split(",")
-        ]
-        for group in value.splitlines()
-    ]
+    sections = array("q")
+    for line in lines:
+        if line:
+            assignments = line.split(",")
+            if len(assignments) != 2:
+                raise ValueError(f"Invalid pair of assignments: {line!r}")
+            for assignment in assignments:
+                bounds = assignment.split("-")
+                if len(bounds) != 2:
+                    raise ValueError(f"Invalid assignment: {assignment!r}")
+                start, end = map(int, bounds)
+                if start > end:
+                    raise ValueError(
+                        f"Assignment ends before it starts: {assignment!r}"
+                    )
+                sections.append(start)
+                sections.append(end)
+    return sections
+
+
+def iter_pairs(sections: "array[int]") -> Iterator[tuple[int, int, int, int]]:
+    """Iterate over the pairs of assignments.
+
+    Parameters
+    ----------
+    sections: array[int]
+        The parsed input, from :func:`parse_input`.
+
+    Yields
+    ------
+    tuple[int, int, int, int]
+        The start and end of the first assignment, then of the second.
+    """
+    return zip(sections[0::4], sections[1::4], sections[2::4], sections[3::4])
+
+
+class Coverage:
+    """How many elves are assigned to each section, across every assignment in the
+    input. Built with a sweep over the assignment bounds in O(n log n), after which
+    many queries can be answered.
+
+    Assignments are numbered in input order, so assignment ``i`` is at
+    ``sections[2 * i : 2 * i + 2]``, and belongs to pair ``i // 2``.
+
+    Attributes
+    ----------
+    sections: array[int]
+        The parsed input, from :func:`parse_input`.
+    bounds: array[int]
+        The sections where the number of assigned elves changes, in ascending order.
+    depths: array[int]
+        The number of elves assigned to the sections from ``bounds[i]`` up to
+        ``bounds[i + 1]``. Sections after the last bound are unassigned.
+    """
+
+    def __init__(self, sections: "array[int]") -> None:
+        self.sections = sections
+        deltas: Counter[int] = Counter()
+        for start, end in zip(sections[0::2], sections[1::2]):
+            deltas[start] += 1
+            deltas[end + 1] -= 1
+        self.bounds = array("q", sorted(deltas))
+        self.depths = array("q")
+        depth = 0
+        for bound in self.bounds:
+            depth += deltas[bound]
+            self.depths.append(depth)
+
+    def depth(self, section: int) -> int:
+        """Get the number of elves assigned to a section.
+
+        Parameters
+        ----------
+        section: int
+            The section.
+
+        Returns
+        -------
+        int
+            The number of elves.
+        """
+        index = bisect_right(self.bounds, section) - 1
+        return self.depths[index] if index >= 0 else 0
+
+    def max_depth(self) -> int:
+        """Get the largest number of elves assigned to any one section.
+
+        Returns
+        -------
+        int
+            The number of elves.
+        """
+        return max(self.depths, default=0)
+
+    def covered(self, more_than: int) -> list[tuple[int, int]]:
+        """Get the sections assigned to more than ``more_than`` elves.
+
+        Parameters
+        ----------
+        more_than: int
+            The number of elves to exceed.
+
+        Returns
+        -------
+        list[tuple[int, int]]
+            The first and last section of each run of such sections, in order.
+        """
+        ranges: list[tuple[int, int]] = []
+        start = None
+        for bound, depth in zip(self.bounds, self.depths):
+            if depth > more_than and start is None:
+                start = bound
+            elif depth <= more_than and start is not None:
+                ranges.append((start, bound - 1))
+                start = None
+        return ranges
+
+    def overlapping(self) -> Iterator[tuple[int, int]]:
+        """Find every pair of assignments that share a section. The assignments are
+        swept in order of their start, while a heap keeps the ones still open, so this
+        takes O(n log n) plus the number of pairs found.
+
+        Yields
+        ------
+        tuple[int, int]
+            The numbers of the two assignments, the smaller first.
+        """
+        starts = self.sections[0::2]
+        ends = self.sections[1::2]
+        open_: list[tuple[int, int]] = []
+        for index in sorted(range(len(starts)), key=starts.__getitem__):
+            start = starts[index]
+            while open_ and open_[0][0] < start:
+                heapq.heappop(open_)
+            for _, other in open_:
+                yield min(index, other), max(index, other)
+            heapq.heappush(open_, (ends[index], index))
+
+
+def parse_coverage(lines: Iterable[str]) -> Coverage:
+    """Parse the input via :func:`parse_input`, and build its :class:`Coverage`.
+
+    Parameters
+    ----------
+    lines: Iterable[str]
+        The lines of the input to parse.
+
+    Returns
+    -------
+    Coverage
+        The coverage of the input.
+    """
+    return Coverage(parse_input(lines))
 
 
 class Day4(Day):
     """Day 4: Camp Cleanup"""
 
-    @part(1)
-    def part_1(self, value: str) -> int:
-        """Part 1 of the challenge. Takes the input and parses it, then returns the
-        result.
+    def coverage(self, title: int | str = 1) -> Coverage:
+        """Get the coverage of the input, for aggregate queries across every
+        assignment. It is cached along with the input.
+
+        Parameters
+        ----------
+        title: int | str
+            The title of the part whose input to use.
+
+        Returns
+        -------
+        Coverage
+            The coverage of the input.
+        """
+        return self.get_parsed(title, parse_coverage, stream=True)
+
+    @part(1, parser=parse_input, stream=True)
+    def part_1(self, value: "array[int]") -> int:
+        """Part 1 of the challenge. Takes the input parsed via :func:`parse_input`,
+        then returns the number of pairs where one assignment contains the other.
 
         Parameters
         ----------
-        value: str
-            The input to parse.
+        value: array[int]
+            The parsed input.
 
         Returns
         -------
         int
             The result of the challenge.
         """
-        groups = parse_input(value)
-        total = 0
-        for group in groups:
-            start_len = len(group[1])
-            for item in group[0]:
-                if item in group[1]:
-                    group[1].remove(item)
-            total += bool(
-                len(group[1]) == 0 or len(group[0]) == start_len - len(group[1])
-            )
-        return total
-
-    @part(2)
-    def part_2(self, value: str) -> int:
-        """Part 2 of the challenge. Takes the input and parses it, then returns the
-        result.
+        return sum(
+            (start1 <= start2 and end2 <= end1) or (start2 <= start1 and end1 <= end2)
+            for start1, end1, start2, end2 in iter_pairs(value)
+        )
+
+    @part(2, parser=parse_input, stream=True)
+    def part_2(self, value: "array[int]") -> int:
+        """Part 2 of the challenge. Takes the input parsed via :func:`parse_input`,
+        then returns the number of pairs where the assignments overlap.
 
         Parameters
         ----------
-        value: str
-            The input to parse.
+        value: array[int]
+            The parsed input.
 
         Returns
         -------
         int
             The result of the challenge.
         """
-        groups = parse_input(value)
-        total = 0
-        for group in groups:
-            total += int(any(item in group[1] for item in group[0]))
-        return total
+        return sum(
+            start1 <= end2 and start2 <= end1
+            for start1, end1, start2, end2 in iter_pairs(value)
+        )
 
 
 if __name__ == "__main__":
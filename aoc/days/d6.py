@@ -21,48 +21,160 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
-import collections
+import functools
+import mmap
 from collections.abc import Iterable, Iterator
-from itertools import islice
-from typing import TypeVar
+from typing import BinaryIO
 
 from aoc.utils import Day, part
 
-V = TypeVar("V")
 
+class MarkerScanner:
+    """Finds markers, windows of distinct bytes, in a stream fed in chunks. Several
+    window sizes are checked in the same pass, and the state is kept between chunks,
+    so a marker may span chunk boundaries.
 
-def sliding_window(iterable: Iterable[V], size: int) -> Iterator[tuple[V, ...]]:
-    """Create a sliding window of the given size.
+    The scan keeps the start of the longest run of distinct bytes ending at the
+    current byte, and the index each byte value was last seen at. When the current
+    byte was last seen inside the run, the run restarts just after it. A window of
+    size ``n`` ends at every byte where the run is at least ``n`` long.
+
+    Attributes
+    ----------
+    window_sizes: tuple[int, ...]
+        The window sizes to check, in ascending order.
+    every: bool
+        Whether to report every marker, rather than only the first of each size.
+    offset: int
+        The number of bytes fed so far.
+    first: dict[int, int]
+        The end offset of the first marker found for each window size.
+    """
+
+    def __init__(self, window_sizes: Iterable[int], every: bool = False) -> None:
+        self.window_sizes = tuple(sorted(set(window_sizes)))
+        if not self.window_sizes or not 0 < self.window_sizes[0] <= 256:
+            raise ValueError("Window sizes must be between 1 and 256")
+        self.every = every
+        self.offset = 0
+        self.first: dict[int, int] = {}
+        self._last_seen = [-1] * 256
+        self._start = 0
+
+    @property
+    def done(self) -> bool:
+        """Whether there is nothing left to find."""
+        return not self.every and len(self.first) == len(self.window_sizes)
+
+    def feed(self, chunk: bytes | mmap.mmap) -> list[tuple[int, int]]:
+        """Scan the next chunk of the stream. Once :attr:`done`, nothing is scanned.
+
+        Parameters
+        ----------
+        chunk: bytes | mmap.mmap
+            The chunk.
+
+        Returns
+        -------
+        list[tuple[int, int]]
+            The window size and end offset of each marker found in the chunk.
+        """
+        found: list[tuple[int, int]] = []
+        if self.done:
+            return found
+        last_seen = self._last_seen
+        start = self._start
+        # The run grows by at most one byte at a time, so the first marker of a size
+        # is where the run first reaches that size
+        pending = [size for size in self.window_sizes if size not in self.first]
+        smallest = self.window_sizes[0] if self.every else pending[0]
+        with memoryview(chunk) as view:
+            for index, byte in enumerate(view, self.offset):
+                if last_seen[byte] >= start:
+                    start = last_seen[byte] + 1
+                last_seen[byte] = index
+                if (length := index - start + 1) < smallest:
+                    continue
+                if self.every:
+                    for size in self.window_sizes:
+                        if size > length:
+                            break
+                        self.first.setdefault(size, index + 1)
+                        found.append((size, index + 1))
+                    continue
+                while pending and pending[0] <= length:
+                    size = pending.pop(0)
+                    self.first[size] = index + 1
+                    found.append((size, index + 1))
+                if not pending:
+                    break
+                smallest = pending[0]
+            # Keep the offset on the same scale as the indices in last_seen, even if
+            # the scan stopped early
+            self.offset += len(view)
+        self._start = start
+        return found
+
+
+def iter_chunks(
+    source: Iterable[bytes] | BinaryIO, chunk_size: int = 1 << 16
+) -> Iterator[bytes]:
+    """Iterate over the chunks of a stream.
+
+    Parameters
+    ----------
+    source: Iterable[bytes] | BinaryIO
+        The chunks, or a binary file object to read them from.
+    chunk_size: int
+        The size of the chunks read from a file object.
+
+    Returns
+    -------
+    Iterator[bytes]
+        The chunks.
+    """
+    if (read := getattr(source, "read", None)) is not None:
+        return iter(functools.partial(read, chunk_size), b"")
+    return iter(source)
+
+
+def scan_markers(
+    source: Iterable[bytes] | BinaryIO,
+    window_sizes: Iterable[int] = (4, 14),
+    every: bool = False,
+) -> Iterator[tuple[int, int]]:
+    """Find markers in a stream, without buffering it. Markers are yielded as soon as
+    the chunk containing them has been scanned, and reading stops once the first
+    marker of each size has been found, unless ``every`` is set.
 
     Parameters
     ----------
-    iterable: Iterable[V]
-        The iterable to create a sliding window of.
-    size: int
-        The size of the window.
+    source: Iterable[bytes] | BinaryIO
+        The chunks of the stream, or a binary file object to read them from.
+    window_sizes: Iterable[int]
+        The window sizes to look for.
+    every: bool
+        Whether to find every marker, rather than only the first of each size.
 
     Yields
     ------
-    tuple[V, ...]
-        The window.
+    tuple[int, int]
+        The window size and end offset of each marker, in order of offset.
     """
-    # sliding_window('ABCDEFG', 4) --> ABCD BCDE CDEF DEFG
-    # https://docs.python.org/3/library/itertools.html#itertools-recipes
-    itr = iter(iterable)
-    window = collections.deque(islice(itr, size), maxlen=size)
-    if len(window) == size:
-        yield tuple(window)
-    for val in itr:
-        window.append(val)
-        yield tuple(window)
+    scanner = MarkerScanner(window_sizes, every)
+    for chunk in iter_chunks(source):
+        yield from scanner.feed(chunk)
+        if scanner.done:
+            return
 
 
-def logic(value: str, window_size: int) -> int:
-    """Logic for both parts.
+def logic(value: bytes | mmap.mmap, window_size: int) -> int:
+    """Logic for both parts. Finds the end of the first window of ``window_size``
+    distinct bytes in a single pass, in constant memory. See :class:`MarkerScanner`.
 
     Parameters
     ----------
-    value: str
+    value: bytes | mmap.mmap
         The input.
     window_size: int
         The size of the sliding window.
@@ -72,23 +184,23 @@ def logic(value: str, window_size: int) -> int:
     int
         The answer.
     """
-    window = enumerate(sliding_window(value, window_size))
-    for i, win in window:
-        if len(set(win)) == window_size:
-            return i + window_size
-    raise ValueError("No valid window found")  # pragma: no cover
+    scanner = MarkerScanner((window_size,))
+    scanner.feed(value)
+    if window_size not in scanner.first:
+        raise ValueError("No valid window found")
+    return scanner.first[window_size]
 
 
 class Day6(Day):
     """Day 6: Tuning Trouble"""
 
-    @part(1)
-    def part_1(self, value: str) -> int:
+    @part(1, buffer=True)
+    def part_1(self, value: bytes | mmap.mmap) -> int:
         """Part 1.
 
         Parameters
         ----------
-        value: str
+        value: bytes | mmap.mmap
             The input.
 
         Returns
@@ -98,13 +210,13 @@ class Day6(Day):
         """
         return logic(value, 4)
 
-    @part(2)
-    def part_2(self, value: str) -> int:
+    @part(2, buffer=True)
+    def part_2(self, value: bytes | mmap.mmap) -> int:
         """Part 2.
 
         Parameters
         ----------
-        value: str
+        value: bytes | mmap.mmap
             The input.
 
         Returns
@@ -114,6 +226,30 @@ class Day6(Day):
         """
         return logic(value, 14)
 
+    def markers(
+        self,
+        source: Iterable[bytes] | BinaryIO,
+        window_sizes: Iterable[int] = (4, 14),
+        every: bool = False,
+    ) -> Iterator[tuple[int, int]]:
+        """Find markers in a stream of signal data. See :func:`scan_markers`.
+
+        Parameters
+        ----------
+        source: Iterable[bytes] | BinaryIO
+            The chunks of the stream, or a binary file object to read them from.
+        window_sizes: Iterable[int]
+            The window sizes to look for.
+        every: bool
+            Whether to find every marker, rather than only the first of each size.
+
+        Returns
+        -------
+        Iterator[tuple[int, int]]
+            The window size and end offset of each marker, in order of offset.
+        """
+        return scan_markers(source, window_sizes, every)
+
 
 if __name__ == "__main__":
     Day6().run()
@@ -21,6 +21,10 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
+import heapq
+import threading
+from array import array
+from collections.abc import Iterable
 
 from aoc.utils import Day, part
 
@@ -28,6 +32,8 @@ from aoc.utils import Day, part
 class Item:  # pylint: disable=too-few-public-methods
     """Base class for all items in the filetree."""
 
+    __slots__ = ("name", "parent")
+
     def __init__(self, name: str, parent: "Directory | None"):
         self.name = name
         self.parent = parent
@@ -41,6 +47,8 @@ class Item:  # pylint: disable=too-few-public-methods
 class File(Item):
     """A file in the filetree."""
 
+    __slots__ = ("_size",)
+
     def __init__(self, name: str, parent: "Directory | None", size: int):
         super().__init__(name, parent)
         self._size = size
@@ -54,30 +62,33 @@ class File(Item):
 
 
 class Directory(Item):
-    """A directory in the filetree."""
+    """A directory in the filetree. Its size is stored by the :class:`FileSystem` that
+    owns it, at :attr:`index`. Its children are indexed by name.
+    """
 
-    instances: list["Directory"] = []
+    __slots__ = ("children", "filesystem", "index")
 
-    def __init__(self, name: str, parent: "Directory | None"):
+    def __init__(self, name: str, parent: "Directory | None", filesystem: "FileSystem"):
         super().__init__(name, parent)
-        self.children: list[Item] = []
-        self.instances.append(self)
+        self.children: dict[str, Item] = {}
+        self.filesystem = filesystem
+        self.index = filesystem.register(self)
 
     # def __repr__(self) -> str:
     #     return f"- {self.name} (dir)\n" + textwrap.indent(
-    #         "\n".join(repr(f) for f in self.children), "  "
+    #         "\n".join(repr(f) for f in self.children.values()), "  "
     #     )
 
-    @classmethod
-    def root(cls) -> "Directory":
-        """Returns the root directory."""
-        if not cls.instances:
-            return cls("/", None)
-        return cls.instances[0]
-
     def add(self, item: Item) -> None:
-        """Adds an item to the directory."""
-        self.children.append(item)
+        """Adds an item to the directory, replacing any item with the same name, as
+        when a directory is listed again."""
+        old = self.children.get(item.name)
+        self.children[item.name] = item
+        delta = item.size if isinstance(item, File) else 0
+        if isinstance(old, File):
+            delta -= old.size
+        if delta:
+            self.filesystem.add_file_size(self.index, delta)
 
     def cd(self, path: str) -> "Directory":  # pylint: disable=invalid-name
         """Changes the current directory to the given path."""
@@ -85,27 +96,148 @@ class Directory(Item):
             if self.parent:
                 return self.parent
         elif path == "/":
-            return self.instances[0]
-        for child in self.children:
-            if child.name == path and isinstance(child, Directory):
-                return child
-        new_dir = Directory(path, self)
-        self.children.append(new_dir)
+            return self.filesystem.root
+        if isinstance(child := self.children.get(path), Directory):
+            return child
+        new_dir = Directory(path, self, self.filesystem)
+        self.children[path] = new_dir
         return new_dir
 
     @property
     def size(self) -> int:
-        return sum(child.size for child in self.children)
+        return self.filesystem.sizes()[self.index]
+
+
+class FileSystem:
+    """A filetree, which owns all of its directories. Separate filetrees share no
+    state, so they can be built concurrently. Querying never changes a fed filetree,
+    so it can be queried from several threads at once.
+
+    The sizes of the directories are kept in flat arrays indexed by
+    :attr:`Directory.index`, rather than recomputed from the tree. When a file is
+    added, its size is recorded as a pending change to its directory. The pending
+    changes are applied at the end of :meth:`feed`, by adding each one to its
+    directory and passing it on to the parent. A directory is always created after
+    its parent, so its index is larger than its parent's, and applying the changes in
+    reverse index order merges them into a single walk up the tree. Adding more of a
+    transcript with :meth:`feed` therefore only costs time for the directories it
+    touches and their ancestors, not for the whole tree.
 
-    @classmethod
-    def get_sum(cls) -> int:
-        """Return the sum of all instance sizes that are under 100000"""
-        return sum(
-            instance.size for instance in cls.instances if instance.size < 100000
-        )
+    Attributes
+    ----------
+    directories: list[Directory]
+        Every directory, in the order they were created.
+    parents: array[int]
+        The index of each directory's parent, -1 for the root.
+    file_sizes: array[int]
+        The total size of the files directly inside each directory.
+    root: Directory
+        The root directory.
+    cwd: Directory
+        The current directory, where :meth:`feed` resumes.
+    """
+
+    def __init__(self) -> None:
+        self.directories: list[Directory] = []
+        self.parents = array("q")
+        self.file_sizes = array("q")
+        self._sizes = array("q")
+        self._pending: dict[int, int] = {}
+        self._lock = threading.Lock()
+        self.root = Directory("/", None, self)
+        self.cwd = self.root
+
+    def register(self, directory: Directory) -> int:
+        """Adds a new directory to the filetree.
 
-    @classmethod
-    def free_space(cls, needed: int) -> int:
+        Parameters
+        ----------
+        directory: Directory
+            The directory to add.
+
+        Returns
+        -------
+        int
+            The index of the directory.
+        """
+        self.directories.append(directory)
+        self.parents.append(-1 if directory.parent is None else directory.parent.index)
+        self.file_sizes.append(0)
+        self._sizes.append(0)
+        return len(self.directories) - 1
+
+    def add_file_size(self, index: int, size: int) -> None:
+        """Adds the size of a new file to a directory, or the change in size of a
+        replaced file.
+
+        Parameters
+        ----------
+        index: int
+            The index of the directory.
+        size: int
+            The size to add.
+        """
+        self.file_sizes[index] += size
+        self._pending[index] = self._pending.get(index, 0) + size
+
+    def feed(self, lines: Iterable[str]) -> None:
+        """Add more of the transcript, resuming from :attr:`cwd`. The input is read in
+        a single pass, one line at a time, so it can be streamed.
+
+        Parameters
+        ----------
+        lines: Iterable[str]
+            The lines of the transcript.
+        """
+        cwd = self.cwd
+        for line in lines:
+            if line.startswith("$"):
+                # Only cd changes the state, the lines after an ls are its output
+                if line.startswith("$ cd "):
+                    cwd = cwd.cd(line[5:])
+            # If the line starts with "dir", it's a directory, otherwise it's a file
+            elif line.startswith("dir "):
+                cwd.cd(line[4:])
+            elif line:
+                # Split the line into the file size and the file name
+                size, name = line.split(" ", 1)
+                cwd.add(File(name, cwd, int(size)))
+        self.cwd = cwd
+        self.apply_pending()
+
+    def apply_pending(self) -> None:
+        """Apply the pending changes to the sizes of the directories. This is done by
+        :meth:`feed`, and is only needed after calling :meth:`Directory.add` directly.
+        """
+        with self._lock:
+            pending = self._pending
+            sizes = self._sizes
+            parents = self.parents
+            # A max heap of the directories with pending changes
+            heap = [-index for index in pending]
+            heapq.heapify(heap)
+            while heap:
+                index = -heapq.heappop(heap)
+                delta = pending.pop(index)
+                sizes[index] += delta
+                if (parent := parents[index]) >= 0:
+                    if parent in pending:
+                        pending[parent] += delta
+                    else:
+                        pending[parent] = delta
+                        heapq.heappush(heap, -parent)
+
+    def sizes(self) -> "array[int]":
+        """Returns the size of every directory, indexed by :attr:`Directory.index`."""
+        if self._pending:
+            self.apply_pending()
+        return self._sizes
+
+    def get_sum(self) -> int:
+        """Return the sum of all directory sizes that are under 100000"""
+        return sum(size for size in self.sizes() if size < 100000)
+
+    def free_space(self, needed: int) -> int:
         """Available space is 70000000. We need to have``needed`` available, so find the
         smallest directory that we can delete to free up space.
 
@@ -119,81 +251,66 @@ class Directory(Item):
         int
             The size of the smallest directory that can be deleted.
         """
-        return min(
-            instance.size
-            for instance in cls.instances
-            if instance.size > (needed - 70000000 + cls.root().size)
-        )
+        sizes = self.sizes()
+        minimum = needed - 70000000 + sizes[0]
+        return min(size for size in sizes if size > minimum)
 
 
-def parse_input(value: str) -> None:
-    """Parse the input and create the directory structure. All the necessary data is
-    stored on the :class:`Directory` class.
+def parse_input(lines: Iterable[str]) -> FileSystem:
+    """Parse the input and create the directory structure. See
+    :meth:`FileSystem.feed`.
 
     Parameters
     ----------
-    value: str
-        The input to parse.
+    lines: Iterable[str]
+        The lines of the input to parse.
+
+    Returns
+    -------
+    FileSystem
+        The filetree.
     """
-    Directory.instances = []
-    cwd = Directory.root()
-    lines = list(enumerate(value.splitlines()))
-    commands = [(i, line[2:]) for i, line in lines if line.startswith("$")]
-    for i, line in commands:
-        if line.startswith("cd"):
-            cwd = cwd.cd(line[3:])
-        elif line.startswith("ls"):
-            # Iterate through the lines until the next command, and add them to the filetree
-            for _, data in lines[i + 1 :]:
-                if data.startswith("$"):
-                    break
-                # If the line starts with "dir", it's a directory, otherwise it's a file
-                if data.startswith("dir"):
-                    cwd.cd(data[4:])
-                else:
-                    # Split the line into the file size and the file name
-                    size, name = data.split(" ", 1)
-                    cwd.add(File(name, cwd, int(size)))
+    filesystem = FileSystem()
+    filesystem.feed(lines)
+    return filesystem
 
 
 class Day7(Day):
     """Day 7: No Space Left On Device"""
 
-    @part(1)
-    def part_1(self, value: str) -> int:
-        """Part 1 of the challenge. Takes the input and parses it, then returns the
-        result.
+    @part(1, parser=parse_input, stream=True)
+    def part_1(self, value: FileSystem) -> int:
+        """Part 1 of the challenge. Takes the input parsed via :func:`parse_input`,
+        then returns the result.
 
         Parameters
         ----------
-        value: str
-            The input to parse.
+        value: FileSystem
+            The parsed input.
 
         Returns
         -------
         int
             The result of the challenge.
         """
-        parse_input(value)
-        return Directory.get_sum()
+        return value.get_sum()
 
-    @part(2)
-    def part_2(self, value: str) -> int:
-        """Part 1 of the challenge. Takes the input and parses it, then returns the
-        result.
+    @part(2, parser=parse_input, stream=True)
+    def part_2(self, value: FileSystem) -> int:
+        """Part 2 of the challenge. Takes the input parsed via :func:`parse_input`,
+        then returns the result.
 
         Parameters
         ----------
-        value: str
-            The input to parse.
+        value: FileSystem
+            The parsed input.
 
         Returns
         -------
         int
             The result of the challenge.
         """
-        parse_input(value)
-        return Directory.free_space(30000000)
+        return value.free_space(30000000)
 
 
 if __name__ == "__main__":
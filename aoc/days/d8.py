@@ -21,15 +21,29 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
+import mmap
+import os
+from array import array
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from math import prod
+from multiprocessing import shared_memory
+from typing import Any
 
-from aoc.utils import Day, part
+from aoc.utils import Day, iter_lines, part
+
+try:
+    import numpy as np
+    import numpy.typing as npt
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
 
 __all__ = ("Day8",)
 
 
-def logic(value: str, part2: bool = False) -> int:
-    values = [list(map(int, list(v))) for v in value.splitlines()]
+def logic(value: bytes | mmap.mmap, part2: bool = False) -> int:
+    grid, cols = grid_bytes(value)
+    values = [grid[start : start + cols] for start in range(0, len(grid), cols or 1)]
     result = 0
     for row in range(len(values)):
         for col in range(len(values[row])):
@@ -72,16 +86,366 @@ def logic(value: str, part2: bool = False) -> int:
     return result
 
 
+def naive_logic(value: bytes | mmap.mmap) -> tuple[int, int]:
+    """The original logic, run once for each part. See :func:`logic`.
+
+    Parameters
+    ----------
+    value: bytes | mmap.mmap
+        The input.
+
+    Returns
+    -------
+    tuple[int, int]
+        The number of visible trees, and the highest scenic score.
+    """
+    return logic(value), logic(value, True)
+
+
+def grid_bytes(value: bytes | mmap.mmap) -> tuple[bytearray, int]:
+    """Load the input as a flat grid of tree heights, one byte per tree in row-major
+    order. The heights are the digits' byte values, which compare like the digits.
+
+    Parameters
+    ----------
+    value: bytes | mmap.mmap
+        The input.
+
+    Returns
+    -------
+    tuple[bytearray, int]
+        The grid, and the number of columns.
+    """
+    grid = bytearray()
+    cols = 0
+    for row in iter_lines(value):
+        grid += row
+        cols = cols or len(row)
+    return grid, cols
+
+
+def _sweep(
+    grid: bytearray | memoryview,
+    line: range,
+    visible: bytearray | memoryview,
+    score: "array[int] | memoryview",
+) -> None:
+    # Walk along a row or column of the grid, given as its indices in the flat grid.
+    # Trees taller than the running maximum are visible from the start of the line. A
+    # monotonic stack holds the positions of the trees that may still block the view
+    # towards the start: a tree hides every shorter tree behind it, so those are
+    # popped, and the top of the stack is the nearest tree at least as tall.
+    tallest = -1
+    stack_heights: list[int] = []
+    stack_positions: list[int] = []
+    for position, index in enumerate(line):
+        height = grid[index]
+        if height > tallest:
+            tallest = height
+            visible[index] = 1
+        while stack_heights and stack_heights[-1] < height:
+            stack_heights.pop()
+            stack_positions.pop()
+        score[index] *= position - stack_positions[-1] if stack_positions else position
+        stack_heights.append(height)
+        stack_positions.append(position)
+
+
+def stack_logic(value: bytes | mmap.mmap) -> tuple[int, int]:
+    """Linear time logic for both parts, in pure Python. Every row and column is swept
+    once in each direction, see :func:`_sweep`.
+
+    Parameters
+    ----------
+    value: bytes | mmap.mmap
+        The input.
+
+    Returns
+    -------
+    tuple[int, int]
+        The number of visible trees, and the highest scenic score.
+    """
+    grid, cols = grid_bytes(value)
+    size = len(grid)
+    if size == 0:
+        return 0, 0
+    visible = bytearray(size)
+    score = array("q", [1]) * size
+    for start in range(0, size, cols):
+        _sweep(grid, range(start, start + cols), visible, score)
+        _sweep(grid, range(start + cols - 1, start - 1, -1), visible, score)
+    for col in range(cols):
+        _sweep(grid, range(col, size, cols), visible, score)
+        _sweep(grid, range(size - cols + col, -1, -cols), visible, score)
+    return sum(visible), max(score)
+
+
+def _band(
+    names: tuple[str, str, str],
+    size: int,
+    cols: int,
+    by_row: bool,
+    start: int,
+    stop: int,
+) -> tuple[int, int]:
+    # Runs in a worker process. Attach to the shared grid, visible flags and scores,
+    # and sweep rows or columns start to stop in both directions. The columns are
+    # swept after all the rows, so their cells are final and can be summarized.
+    blocks = [shared_memory.SharedMemory(name) for name in names]
+    grid, visible, score = blocks[0].buf, blocks[1].buf, blocks[2].buf.cast("q")
+    try:
+        if by_row:
+            score[start * cols : stop * cols] = array("q", [1]) * (
+                (stop - start) * cols
+            )
+            for first in range(start * cols, stop * cols, cols):
+                _sweep(grid, range(first, first + cols), visible, score)
+                _sweep(grid, range(first + cols - 1, first - 1, -1), visible, score)
+            return 0, 0
+        count = highest = 0
+        for col in range(start, stop):
+            _sweep(grid, range(col, size, cols), visible, score)
+            _sweep(grid, range(size - cols + col, -1, -cols), visible, score)
+            count += sum(visible[col:size:cols])
+            highest = max(highest, max(score[col:size:cols]))
+        return count, highest
+    finally:
+        score.release()
+        for block in blocks:
+            block.close()
+
+
+def _bands(count: int, workers: int) -> list[tuple[int, int]]:
+    # Split range(count) into at most ``workers`` contiguous bands
+    step = -(-count // workers)
+    return [(start, min(start + step, count)) for start in range(0, count, step)]
+
+
+def parallel_logic(
+    value: bytes | mmap.mmap, workers: int | None = None
+) -> tuple[int, int]:
+    """Linear time logic for both parts, split across processes. The grid, visible
+    flags and scores are placed in :mod:`multiprocessing.shared_memory`, so the workers
+    share them instead of receiving copies. First, bands of rows are swept in
+    parallel, then bands of columns. The column bands return the visible count and
+    highest score of their columns, which are merged. See :func:`stack_logic`.
+
+    Parameters
+    ----------
+    value: bytes | mmap.mmap
+        The input.
+    workers: int | None
+        The number of worker processes. Defaults to the number of CPUs.
+
+    Returns
+    -------
+    tuple[int, int]
+        The number of visible trees, and the highest scenic score.
+    """
+    workers = workers or os.cpu_count() or 1
+    grid = shared_memory.SharedMemory(create=True, size=max(len(value), 1))
+    blocks = [grid]
+    try:
+        size = cols = 0
+        for row in iter_lines(value):
+            grid.buf[size : size + len(row)] = row
+            size += len(row)
+            cols = cols or len(row)
+        if size == 0:
+            return 0, 0
+        rows = size // cols
+        blocks.append(shared_memory.SharedMemory(create=True, size=size))
+        blocks.append(shared_memory.SharedMemory(create=True, size=size * 8))
+        # New shared memory is zero filled, so no trees are visible yet
+        names = (blocks[0].name, blocks[1].name, blocks[2].name)
+        with ProcessPoolExecutor(workers) as executor:
+            jobs = [
+                executor.submit(_band, names, size, cols, True, start, stop)
+                for start, stop in _bands(rows, workers)
+            ]
+            # Wait for every row to be swept before sweeping the columns
+            for job in jobs:
+                job.result()
+            jobs = [
+                executor.submit(_band, names, size, cols, False, start, stop)
+                for start, stop in _bands(cols, workers)
+            ]
+            results = [job.result() for job in jobs]
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+    return (
+        sum(count for count, _ in results),
+        max(highest for _, highest in results),
+    )
+
+
+def grid_array(value: bytes | mmap.mmap) -> "npt.NDArray[np.uint8]":
+    """Load the input as a 2D array of tree heights, without copying it. Like
+    :func:`grid_bytes`, the heights are bytes.
+
+    Parameters
+    ----------
+    value: bytes | mmap.mmap
+        The input.
+
+    Returns
+    -------
+    npt.NDArray[np.uint8]
+        The grid, a view of the input with the line endings sliced off.
+    """
+    size = len(value)
+    while size and value[size - 1 : size] in (b"\r", b"\n"):
+        size -= 1
+    if size == 0:
+        return np.zeros((0, 0), np.uint8)
+    if (width := value.find(b"\n", 0, size)) == -1:
+        width = size
+    stride = width + 1
+    if value[width - 1 : width] == b"\r":
+        width -= 1
+    if (length := size + stride - width) % stride:
+        raise ValueError("The rows of the grid must all be the same length")
+    if length <= len(value):
+        data = np.frombuffer(value, np.uint8, length)
+    else:
+        # The last line has no line ending, so add one to make every row the same length
+        data = np.concatenate(
+            (np.frombuffer(value, np.uint8, size), np.zeros(length - size, np.uint8))
+        )
+    grid = data.reshape(-1, stride)
+    if not (grid[:-1, width:] == np.frombuffer(value[width:stride], np.uint8)).all():
+        raise ValueError("The rows of the grid must all be the same length")
+    return grid[:, :width]
+
+
+def _view_left(grid: "npt.NDArray[np.uint8]") -> "npt.NDArray[np.int64]":
+    # The distance from each tree to the nearest tree to its left that is at least as
+    # tall, or to the edge. For each height, a running maximum over the indices of the
+    # trees at least that tall finds the nearest blocker of every tree of that height.
+    indices = np.arange(grid.shape[1])
+    distances = np.zeros(grid.shape, np.int64)
+    for height in np.unique(grid):
+        blockers = np.maximum.accumulate(np.where(grid >= height, indices, 0), axis=1)
+        nearest = np.zeros_like(blockers)
+        nearest[:, 1:] = blockers[:, :-1]
+        mask = grid == height
+        distances[mask] = (indices - nearest)[mask]
+    return distances
+
+
+def _visible_left(grid: "npt.NDArray[np.uint8]") -> "npt.NDArray[np.bool_]":
+    # Whether each tree is taller than every tree to its left
+    tallest = np.full(grid.shape, -1, np.int16)
+    tallest[:, 1:] = np.maximum.accumulate(grid, axis=1)[:, :-1]
+    result: "npt.NDArray[np.bool_]" = grid > tallest
+    return result
+
+
+def _each_direction(
+    grid: "npt.NDArray[np.uint8]", func: Callable[[Any], Any]
+) -> Iterator[Any]:
+    # Apply a function that looks to the left to views of the grid that look in each
+    # direction, and align the results back with the grid
+    yield func(grid)
+    yield func(grid[:, ::-1])[:, ::-1]
+    yield func(grid.T).T
+    yield func(grid.T[:, ::-1])[:, ::-1].T
+
+
+def numpy_logic(value: bytes | mmap.mmap) -> tuple[int, int]:
+    """Vectorized logic for both parts, using NumPy. Each direction is handled by
+    flipping or transposing the grid so that it looks to the left.
+
+    Parameters
+    ----------
+    value: bytes | mmap.mmap
+        The input.
+
+    Returns
+    -------
+    tuple[int, int]
+        The number of visible trees, and the highest scenic score.
+    """
+    if np is None:  # pragma: no cover
+        raise ImportError("NumPy is required for the numpy engine")
+    grid = grid_array(value)
+    score = np.ones(grid.shape, np.int64)
+    for distances in _each_direction(grid, _view_left):
+        score *= distances
+    visible = np.zeros(grid.shape, np.bool_)
+    for visible_from in _each_direction(grid, _visible_left):
+        visible |= visible_from
+    return int(visible.sum()), int(score.max(initial=0))
+
+
+ENGINES: dict[str, Callable[[bytes | mmap.mmap], tuple[int, int]]] = {
+    "naive": naive_logic,
+    "numpy": numpy_logic,
+    "parallel": parallel_logic,
+    "python": stack_logic,
+}
+
+
 class Day8(Day):
-    """Day 8: Treetop Tree House"""
+    """Day 8: Treetop Tree House
+
+    Attributes
+    ----------
+    engine: str
+        The key in :data:`ENGINES` of the logic to use. ``"auto"`` uses ``"numpy"``
+        when NumPy is installed, and ``"python"`` otherwise.
+    """
+
+    engine: str = "auto"
+
+    def config(self) -> dict[str, Any]:
+        return {"engine": self.engine}
+
+    def analyze(self, value: bytes | mmap.mmap) -> tuple[int, int]:
+        """Run the selected engine. Both parts parse the input with this, so the
+        engine runs once for both.
+
+        Parameters
+        ----------
+        value: bytes | mmap.mmap
+            The input.
+
+        Returns
+        -------
+        tuple[int, int]
+            The number of visible trees, and the highest scenic score.
+        """
+        engine = self.engine
+        if engine == "auto":
+            engine = "python" if np is None else "numpy"
+        return ENGINES[engine](value)
+
+    def logic(self, value: bytes | mmap.mmap, part2: bool = False) -> int:
+        """Run the selected engine for one part. See :meth:`analyze`.
+
+        Parameters
+        ----------
+        value: bytes | mmap.mmap
+            The input.
+        part2: bool
+            Whether to run the logic for part 2.
+
+        Returns
+        -------
+        int
+            The answer.
+        """
+        return self.analyze(value)[part2]
 
-    @part(1)
-    def part_1(self, value: str) -> int:
-        return logic(value)
+    @part(1, parser="analyze", buffer=True)
+    def part_1(self, value: tuple[int, int]) -> int:
+        return value[0]
 
-    @part(2)
-    def part_2(self, value: str) -> int:
-        return logic(value, part2=True)
+    @part(2, parser="analyze", buffer=True)
+    def part_2(self, value: tuple[int, int]) -> int:
+        return value[1]
 
 
 if __name__ == "__main__":
@@ -0,0 +1,192 @@
+"""
+MIT License
+
+Copyright (c) 2022 BobDotCom
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+import asyncio
+import contextlib
+import time
+from collections.abc import Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+from aoc.cache import ResultCache
+from aoc.utils import Part, available_days, load_day
+
+__all__ = (
+    "PartResult",
+    "arun_all",
+    "run_all",
+)
+
+
+@dataclass(frozen=True)
+class PartResult:
+    """The outcome of running a single part.
+
+    Attributes
+    ----------
+    day: int
+        The day of the challenge.
+    part: int | str
+        The title of the part.
+    result: Any
+        The return value of the part, or ``None`` if it failed.
+    elapsed: float
+        The wall time spent running the part, in seconds.
+    error: str | None
+        A description of the exception raised by the part, if any.
+    """
+
+    day: int
+    part: int | str
+    result: Any
+    elapsed: float
+    error: str | None = None
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the part ran without raising."""
+        return self.error is None
+
+
+def _run_part(
+    day: int, title: int | str, input_path: str, cache_path: str | None = None
+) -> PartResult:
+    start = time.perf_counter()
+    cache = None if cache_path is None else ResultCache(cache_path)
+    try:
+        result = load_day(day)(input_path, cache).run_part(title)
+    except Exception as exc:  # pylint: disable=broad-except
+        return PartResult(
+            day,
+            title,
+            None,
+            time.perf_counter() - start,
+            f"{type(exc).__name__}: {exc}",
+        )
+    finally:
+        if cache is not None:
+            cache.close()
+    return PartResult(day, title, result, time.perf_counter() - start)
+
+
+def run_all(
+    days: Iterable[int] | None = None,
+    workers: int | None = None,
+    input_path: str = "inputs",
+    executor: Executor | None = None,
+    cache_path: str | None = None,
+) -> list[PartResult]:
+    """Run the parts of several days in parallel. A part that raises is reported in
+    its :class:`PartResult` and does not stop the other parts.
+
+    Parameters
+    ----------
+    days: Iterable[int] | None
+        The days to run. Defaults to every day in :func:`available_days`.
+    workers: int | None
+        The number of worker processes. Defaults to the number of CPUs.
+    input_path: str
+        The input path passed to each :class:`Day`.
+    executor: Executor | None
+        The executor to submit the parts to, instead of a new process pool.
+    cache_path: str | None
+        The path of a :class:`~aoc.cache.ResultCache` database to use for the parts.
+
+    Returns
+    -------
+    list[PartResult]
+        The results, ordered by day and then by part.
+    """
+    days = available_days() if days is None else list(days)
+    jobs = [
+        (day, func.title) for day in days for func in load_day(day)(input_path).parts()
+    ]
+    pool = executor or ProcessPoolExecutor(workers)
+    try:
+        futures = [
+            pool.submit(_run_part, day, title, input_path, cache_path)
+            for day, title in jobs
+        ]
+        return [future.result() for future in futures]
+    finally:
+        if executor is None:
+            pool.shutdown()
+
+
+async def arun_all(
+    days: Iterable[int] | None = None,
+    limit: int | None = None,
+    input_path: str = "inputs",
+    executor: Executor | None = None,
+) -> list[PartResult]:
+    """Run the parts of several days concurrently, without blocking the event loop.
+    A part that raises is reported in its :class:`PartResult` and does not stop the
+    other parts. See :meth:`aoc.utils.Part.acall`.
+
+    Parameters
+    ----------
+    days: Iterable[int] | None
+        The days to run. Defaults to every day in :func:`available_days`.
+    limit: int | None
+        The maximum number of parts running at once. Defaults to no limit.
+    input_path: str
+        The input path passed to each :class:`Day`.
+    executor: Executor | None
+        The executor to solve the parts in. Defaults to the event loop's default
+        executor.
+
+    Returns
+    -------
+    list[PartResult]
+        The results, ordered by day and then by part.
+    """
+    days = available_days() if days is None else list(days)
+    semaphore: contextlib.AbstractAsyncContextManager[Any] = contextlib.nullcontext()
+    if limit is not None:
+        semaphore = asyncio.Semaphore(limit)
+
+    async def run_part(day: int, func: Part) -> PartResult:
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                result = await func.acall(executor)
+            except Exception as exc:  # pylint: disable=broad-except
+                return PartResult(
+                    day,
+                    func.title,
+                    None,
+                    time.perf_counter() - start,
+                    f"{type(exc).__name__}: {exc}",
+                )
+            return PartResult(day, func.title, result, time.perf_counter() - start)
+
+    return list(
+        await asyncio.gather(
+            *(
+                run_part(day, func)
+                for day in days
+                for func in load_day(day)(input_path).parts()
+            )
+        )
+    )
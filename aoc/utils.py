@@ -21,54 +21,304 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
+import cProfile
 import functools
+import hashlib
+import importlib
+import mmap
 import os
-from collections.abc import Callable
-from typing import Any, TypeVar
+import re
+import threading
+import time
+import tracemalloc
+from collections import OrderedDict
+from collections.abc import Callable, Generator, Hashable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from aoc.bench import BenchResult, CallRecord, Timings
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from aoc.cache import ResultCache
 
 __all__ = (
     "Day",
+    "available_days",
+    "day_registry",
+    "iter_lines",
+    "load_day",
     "part",
 )
 
 
+V = TypeVar("V")
+
+
 class Day:
     """Base class for all days. This class is used to store the input for the day,
     and to run the parts of the challenge.
+
+    Attributes
+    ----------
+    cache_size: int
+        The maximum number of inputs and parsed inputs kept in memory. The least
+        recently used entries are evicted first.
+    mmap_threshold: int
+        Inputs no larger than this many bytes are read into :class:`bytes` by
+        :meth:`get_input_buffer` instead of being memory-mapped.
+    result_cache: ResultCache | None
+        If set, the results of parts are looked up in and stored to this cache.
     """
 
-    def __init__(self, input_path: str = "inputs") -> None:
+    cache_size: int = 16
+    mmap_threshold: int = 1 << 16
+    # Maps part titles to attribute names, in definition order
+    _part_attrs: dict[int | str, str] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        attrs: dict[str, Any] = {}
+        for klass in reversed(cls.__mro__):
+            attrs.update(vars(klass))
+        cls._part_attrs = {
+            obj.__part_title__: attr
+            for attr, obj in attrs.items()
+            if hasattr(obj, "__part__")
+        }
+
+    def __init__(
+        self, input_path: str = "inputs", result_cache: "ResultCache | None" = None
+    ) -> None:
         self.input_path = input_path
-        for attr in dir(self):
-            if hasattr((obj := getattr(self, attr)), "__part__"):
-                setattr(self, attr, obj.__part__(self))
-
-    def get_input(self, title: int | str) -> str:
-        """Get the input for the day.
+        self.result_cache = result_cache
+        self._paths: dict[int | str, str] = {}
+        self._cache: OrderedDict[Hashable, Any] = OrderedDict()
+        # Held while loading, so parts run in threads share one load. Loads nest.
+        self._cache_lock = threading.RLock()
+        self._parts: dict[int | str, Part] = {}
+        for title, attr in self._part_attrs.items():
+            self._parts[title] = getattr(self, attr).__part__(self)
+            setattr(self, attr, self._parts[title])
+
+    def find_input(self, title: int | str) -> tuple[str, os.stat_result]:
+        """Find the input file for a part. The resolved path is remembered, so later
+        lookups only need to stat it.
 
         Parameters
         ----------
         title: int | str
-            The title of the day.
+            The title of the part.
 
         Returns
         -------
-        str
-            The input for the day.
+        tuple[str, os.stat_result]
+            The path to the input file, and the result of :func:`os.stat` on it.
         """
+        if (path := self._paths.get(title)) is not None:
+            try:
+                return path, os.stat(path)
+            except FileNotFoundError:
+                del self._paths[title]
         possible_paths = [
             os.path.join(self.input_path, f"{self.get_date()}{title}.txt"),
             os.path.join(self.input_path, f"{self.get_date()}.txt"),
         ]
         for val in possible_paths:
             path = os.path.join(os.path.dirname(__file__), val)
-            if os.path.exists(path):
-                with open(path, encoding="utf-8") as file:
-                    return file.read()
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            self._paths[title] = path
+            return path, stat
         raise FileNotFoundError(
             f"Could not find input for day {self.get_date()} part {title}"
         )
 
+    def _cached(self, key: Hashable, load: Callable[[], V]) -> V:
+        with self._cache_lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                cached: V = self._cache[key]
+                return cached
+            value = load()
+            self._cache[key] = value
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+            return value
+
+    def clear_cache(self) -> None:
+        """Clear all cached inputs and parsed inputs."""
+        with self._cache_lock:
+            self._paths.clear()
+            self._cache.clear()
+
+    def get_input(self, title: int | str) -> str:
+        """Get the input for the day. The input is cached until the file's
+        modification time or size changes.
+
+        Parameters
+        ----------
+        title: int | str
+            The title of the day.
+
+        Returns
+        -------
+        str
+            The input for the day.
+        """
+        path, stat = self.find_input(title)
+
+        def load() -> str:
+            with open(path, encoding="utf-8") as file:
+                return file.read()
+
+        return self._cached((path, stat.st_mtime_ns, stat.st_size), load)
+
+    def config(self) -> dict[str, Any]:
+        """Get the settings of this instance that change how parts are solved. They
+        are part of the :attr:`result_cache` key. Days with settings override this.
+
+        Returns
+        -------
+        dict[str, Any]
+            The settings, by attribute name. The values must have a stable
+            :func:`repr`.
+        """
+        return {}
+
+    def input_digest(self, title: int | str) -> str:
+        """Get the SHA-256 hash of the input for the day. The hash is cached until the
+        file's modification time or size changes.
+
+        Parameters
+        ----------
+        title: int | str
+            The title of the day.
+
+        Returns
+        -------
+        str
+            The hex digest of the input.
+        """
+        path, stat = self.find_input(title)
+
+        def load() -> str:
+            with open(path, "rb") as file:
+                return hashlib.file_digest(file, "sha256").hexdigest()
+
+        return self._cached((path, stat.st_mtime_ns, stat.st_size, "sha256"), load)
+
+    def iter_input(self, title: int | str) -> Generator[str, None, None]:
+        """Iterate over the lines of the input for the day, without their line
+        endings. The file is read lazily through a buffered file handle, and is closed
+        when the generator is exhausted or closed.
+
+        Parameters
+        ----------
+        title: int | str
+            The title of the day.
+
+        Returns
+        -------
+        Generator[str, None, None]
+            The lines of the input.
+        """
+        path, _ = self.find_input(title)
+        return _iter_lines(path)
+
+    def get_input_buffer(self, title: int | str) -> bytes | mmap.mmap:
+        """Get the raw bytes of the input for the day, without decoding them. Inputs
+        larger than :attr:`mmap_threshold` are memory-mapped read-only, so they are
+        not copied into memory. The caller should close the :class:`mmap.mmap` when
+        done with it.
+
+        Parameters
+        ----------
+        title: int | str
+            The title of the day.
+
+        Returns
+        -------
+        bytes | mmap.mmap
+            The input.
+        """
+        path, stat = self.find_input(title)
+        with open(path, "rb") as file:
+            if stat.st_size <= self.mmap_threshold:
+                return file.read()
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def read_input(
+        self, title: int | str, stream: bool = False, buffer: bool = False
+    ) -> Any:
+        """Get the input for the day in the given form.
+
+        Parameters
+        ----------
+        title: int | str
+            The title of the day.
+        stream: bool
+            Return the lines from :meth:`iter_input`.
+        buffer: bool
+            Return the bytes from :meth:`get_input_buffer`.
+
+        Returns
+        -------
+        Any
+            The input, as a string if neither ``stream`` nor ``buffer`` is set.
+        """
+        if stream and buffer:
+            raise ValueError("stream and buffer can not be used together")
+        if stream:
+            return self.iter_input(title)
+        if buffer:
+            return self.get_input_buffer(title)
+        return self.get_input(title)
+
+    def get_parsed(
+        self,
+        title: int | str,
+        parser: Callable[[Any], V],
+        stream: bool = False,
+        buffer: bool = False,
+    ) -> V:
+        """Get the input for the day, parsed by ``parser``. The parsed value is cached
+        alongside the input, so it is shared between parts and must not be mutated.
+
+        Parameters
+        ----------
+        title: int | str
+            The title of the day.
+        parser: Callable[[Any], V]
+            The function used to parse the input.
+        stream: bool
+            Whether ``parser`` takes the lines from :meth:`iter_input` instead of the
+            input as a string. The input itself is then not cached.
+        buffer: bool
+            Whether ``parser`` takes the bytes from :meth:`get_input_buffer` instead
+            of the input as a string. The input itself is then not cached.
+
+        Returns
+        -------
+        V
+            The parsed input.
+        """
+        path, stat = self.find_input(title)
+
+        def load() -> V:
+            value = self.read_input(title, stream, buffer)
+            try:
+                return parser(value)
+            finally:
+                _release(value)
+
+        return self._cached(
+            (path, stat.st_mtime_ns, stat.st_size, parser, stream, buffer), load
+        )
+
     def get_date(self) -> int | str:
         """The day of the challenge. This is used to get the input for the day.
 
@@ -91,11 +341,7 @@ class Day:
         list[Part]
             A list of all parts of the challenge.
         """
-        return [
-            getattr(self, attr)
-            for attr in dir(self)
-            if isinstance(getattr(self, attr), Part)
-        ]
+        return list(self._parts.values())
 
     def run_part(self, title: str | int) -> Any:
         """Run a specific part of the challenge.
@@ -110,20 +356,181 @@ class Day:
         Any
             The return value of the part.
         """
-        for func in self.parts():
-            if func.title == title:
-                return func()
-        raise ValueError(f"Could not find part {title} for day {self.get_date()}")
+        if (func := self._parts.get(title)) is None:
+            raise ValueError(f"Could not find part {title} for day {self.get_date()}")
+        return func()
+
+    def run(
+        self,
+        profile_dir: str | None = None,
+        trace_memory: bool = False,
+        callback: Callable[[CallRecord], None] | None = None,
+    ) -> None:
+        """Run all parts of the challenge. See :meth:`Part.call` for the
+        instrumentation options.
 
-    def run(self) -> None:
-        """Run all parts of the challenge."""
+        Parameters
+        ----------
+        profile_dir: str | None
+            If given, each part is profiled, and the stats are written to
+            ``day{date}_part{title}.pstats`` in this directory.
+        trace_memory: bool
+            Whether to trace memory allocations, and print the peak after each result.
+        callback: Callable[[CallRecord], None] | None
+            Called after each part with a record of the run.
+        """
         for func in self.parts():
-            print(func())
+            profile = None
+            if profile_dir is not None:
+                profile = os.path.join(
+                    profile_dir, f"day{self.get_date()}_part{func.title}.pstats"
+                )
+            records: list[CallRecord] = []
+            result = func.call(profile, trace_memory, records.append)
+            if trace_memory:
+                print(result, f"(peak memory: {records[0].peak_memory} bytes)")
+            else:
+                print(result)
+            if callback is not None:
+                callback(records[0])
+
+    async def arun_part(
+        self, title: str | int, executor: "Executor | None" = None
+    ) -> Any:
+        """Run a specific part of the challenge without blocking the event loop. See
+        :meth:`Part.acall`.
+
+        Parameters
+        ----------
+        title: str | int
+            The title of the part to run.
+        executor: Executor | None
+            The executor to solve the part in.
+
+        Returns
+        -------
+        Any
+            The return value of the part.
+        """
+        if (func := self._parts.get(title)) is None:
+            raise ValueError(f"Could not find part {title} for day {self.get_date()}")
+        return await func.acall(executor)
+
+    async def arun(self, executor: "Executor | None" = None) -> list[Any]:
+        """Run all parts of the challenge concurrently, without blocking the event
+        loop. See :meth:`Part.acall`.
+
+        Parameters
+        ----------
+        executor: Executor | None
+            The executor to solve the parts in.
+
+        Returns
+        -------
+        list[Any]
+            The return values of the parts, in order.
+        """
+        # Imported here rather than at the top, to keep importing a day fast
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        return list(
+            await asyncio.gather(*(func.acall(executor) for func in self.parts()))
+        )
+
+    def bench(self, repeat: int = 10, warmup: int = 1) -> list[BenchResult]:
+        """Benchmark all parts of the challenge. See :meth:`Part.bench`.
+
+        Parameters
+        ----------
+        repeat: int
+            The number of timed runs of each part.
+        warmup: int
+            The number of untimed runs of each part, done before the timed runs.
+
+        Returns
+        -------
+        list[BenchResult]
+            The results, one per part. Use :func:`aoc.bench.dumps` to get JSON.
+        """
+        return [func.bench(repeat, warmup) for func in self.parts()]
 
 
 SELF = TypeVar("SELF", bound=Day)
 
 
+def _run_part(
+    day_cls: type[Day], input_path: str, title: int | str, config: dict[str, Any]
+) -> Any:
+    # Runs in a worker process, so it must be a picklable module level function
+    day = day_cls(input_path)
+    for name, value in config.items():
+        setattr(day, name, value)
+    return day.run_part(title)
+
+
+def _release(value: Any) -> None:
+    # Close inputs that hold on to an open file
+    if isinstance(value, (Generator, mmap.mmap)):
+        value.close()
+
+
+def iter_lines(
+    value: bytes | mmap.mmap, chunk_size: int = 1 << 20
+) -> Generator[bytes, None, None]:
+    """Iterate over the lines of a buffer from :meth:`Day.get_input_buffer`, without
+    their line endings. Blank lines are skipped. The buffer is split in chunks ending
+    at a line break, so an mmap is never copied whole.
+
+    Parameters
+    ----------
+    value: bytes | mmap.mmap
+        The buffer.
+    chunk_size: int
+        The least number of bytes split at once.
+
+    Yields
+    ------
+    bytes
+        The lines.
+    """
+    start = 0
+    while start < len(value):
+        end = value.find(b"\n", start + chunk_size)
+        end = len(value) if end == -1 else end + 1
+        yield from filter(None, value[start:end].splitlines())
+        start = end
+
+
+def _iter_lines(path: str) -> Generator[str, None, None]:
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            yield line.rstrip("\n")
+
+
+@dataclass(frozen=True)
+class InputMode:
+    """How the input of a part is loaded, see :func:`part`.
+
+    Attributes
+    ----------
+    parser: Callable[[Any], Any] | str | None
+        The function used to parse the input before it is passed to the solver, or
+        the name of a method of the day that does.
+    stream: bool
+        Whether the input is passed as an iterator of lines instead of a string.
+    buffer: bool
+        Whether the input is passed as raw bytes instead of a string.
+    """
+
+    parser: Callable[[Any], Any] | str | None = None
+    stream: bool = False
+    buffer: bool = False
+
+    def __post_init__(self) -> None:
+        if self.stream and self.buffer:
+            raise ValueError("stream and buffer can not be used together")
+
+
 class Part:
     """A part of the challenge. To run, simply call this object or use :meth:`.call()`.
 
@@ -131,64 +538,325 @@ class Part:
     ----------
     title: int | str
         The title of the part.
-    func: Callable[[Day], Any]
-        The function to run.
+    func: Callable[[Day, Any], Any]
+        The solver, which takes the day and the input.
     day: Day
         The day of the challenge.
+    parser: Callable[[Any], Any] | str | None
+        The function used to parse the input before it is passed to the solver, or
+        the name of a method of the day that does.
+    stream: bool
+        Whether the input is passed as an iterator of lines instead of a string.
+    buffer: bool
+        Whether the input is passed as raw bytes instead of a string.
     """
 
-    def __init__(self, func: Callable[[SELF], Any], title: int | str, day: SELF):
+    def __init__(
+        self,
+        func: Callable[[SELF, Any], Any],
+        title: int | str,
+        day: SELF,
+        mode: InputMode = InputMode(),
+    ):
         """
         Parameters
         ----------
-        func: Callable[[Day], Any]
-            The function to run.
+        func: Callable[[Day, Any], Any]
+            The solver, which takes the day and the input.
         title: int | str
             The title of the part.
         day: Day
             The day of the challenge.
+        mode: InputMode
+            How the input is loaded. Defaults to the input as a string.
         """
         self.title = title
         self.func = func
         self.day = day
+        self.parser = mode.parser
+        self.stream = mode.stream
+        self.buffer = mode.buffer
 
     def __call__(self) -> Any:
         return self.call()
 
-    def call(self) -> Any:
-        """Run the part of the challenge.
+    def load(self) -> Any:
+        """Load the input for this part, parsing it if the part has a parser.
+
+        Returns
+        -------
+        Any
+            The input.
+        """
+        if isinstance(self.parser, str):
+            parser = getattr(self.day, self.parser)
+            return self.day.get_parsed(self.title, parser, self.stream, self.buffer)
+        if self.parser is not None:
+            return self.day.get_parsed(
+                self.title, self.parser, self.stream, self.buffer
+            )
+        return self.day.read_input(self.title, self.stream, self.buffer)
+
+    def solve(self, value: Any) -> Any:
+        """Run the solver on an already loaded input. A streamed or memory-mapped input
+        is closed once the solver returns.
+
+        Parameters
+        ----------
+        value: Any
+            The input, as returned by :meth:`load`.
 
         Returns
         -------
         Any
             The result of the function.
         """
-        return self.func(self.day)
+        try:
+            return self.func(self.day, value)
+        finally:
+            if self.parser is None:
+                _release(value)
+
+    def call(
+        self,
+        profile: str | None = None,
+        trace_memory: bool = False,
+        callback: Callable[[CallRecord], None] | None = None,
+    ) -> Any:
+        """Run the part of the challenge. If the day has a
+        :attr:`~Day.result_cache`, a cached result is returned when there is one.
+
+        Parameters
+        ----------
+        profile: str | None
+            If given, the part is run under :mod:`cProfile`, and the stats are written
+            to this path. They can be loaded with :class:`pstats.Stats`.
+        trace_memory: bool
+            Whether to trace memory allocations with :mod:`tracemalloc`. The peak is
+            reported in the :class:`~aoc.bench.CallRecord` passed to ``callback``.
+        callback: Callable[[CallRecord], None] | None
+            Called with a record of the run, once the part has returned.
+
+        Returns
+        -------
+        Any
+            The result of the function.
+        """
+        if profile is None and not trace_memory and callback is None:
+            return self._call()
+        profiler = None if profile is None else cProfile.Profile()
+        started_tracing = trace_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        elif trace_memory:
+            tracemalloc.reset_peak()
+        peak_memory = None
+        start = time.perf_counter()
+        try:
+            if profiler is None:
+                result = self._call()
+            else:
+                result = profiler.runcall(self._call)
+        finally:
+            end = time.perf_counter()
+            if trace_memory:
+                peak_memory = tracemalloc.get_traced_memory()[1]
+            if started_tracing:
+                tracemalloc.stop()
+            if profiler is not None and profile is not None:
+                profiler.dump_stats(profile)
+        if callback is not None:
+            callback(
+                CallRecord(
+                    self.day.get_date(), self.title, start, end, result, peak_memory
+                )
+            )
+        return result
+
+    async def acall(self, executor: "Executor | None" = None) -> Any:
+        """Run the part of the challenge without blocking the event loop. The input is
+        loaded in a thread, and the solver is run in ``executor``.
+
+        With a :class:`~concurrent.futures.ProcessPoolExecutor`, the worker process
+        creates its own instance of the day with the same :meth:`~Day.config`, and
+        loads the input itself, so the day must be importable and the settings and
+        result picklable. The result cache isn't used then.
+
+        Parameters
+        ----------
+        executor: Executor | None
+            The executor to solve the part in. Defaults to the event loop's default
+            executor, a thread pool.
+
+        Returns
+        -------
+        Any
+            The result of the function.
+        """
+        # Imported here rather than at the top, to keep importing a day fast
+        import asyncio  # pylint: disable=import-outside-toplevel
+        from concurrent.futures import (  # pylint: disable=import-outside-toplevel
+            ProcessPoolExecutor,
+        )
+
+        loop = asyncio.get_running_loop()
+        if isinstance(executor, ProcessPoolExecutor):
+            return await loop.run_in_executor(
+                executor,
+                _run_part,
+                type(self.day),
+                self.day.input_path,
+                self.title,
+                self.day.config(),
+            )
+        if self.day.result_cache is not None:
+            return await loop.run_in_executor(executor, self._call)
+        value = await asyncio.to_thread(self.load)
+        return await loop.run_in_executor(executor, self.solve, value)
+
+    def _call(self) -> Any:
+        if self.day.result_cache is not None:
+            return self.day.result_cache.get_or_call(
+                self, lambda: self.solve(self.load())
+            )
+        return self.solve(self.load())
+
+    def bench(self, repeat: int = 10, warmup: int = 1) -> BenchResult:
+        """Benchmark this part. Loading the input and solving are timed separately.
+        The day's cache is cleared before each timed run, so loading includes reading
+        and parsing the input. A streamed input is read in full while loading.
+
+        Parameters
+        ----------
+        repeat: int
+            The number of timed runs.
+        warmup: int
+            The number of untimed runs, done before the timed runs.
+
+        Returns
+        -------
+        BenchResult
+            The timings of the timed runs.
+        """
+        if repeat < 1:
+            raise ValueError("repeat must be at least 1")
+        for _ in range(warmup):
+            self.call()
+        load_times = []
+        solve_times = []
+        for _ in range(repeat):
+            self.day.clear_cache()
+            start = time.perf_counter()
+            value = self.load()
+            if self.stream and self.parser is None:
+                value = iter(list(value))
+            loaded = time.perf_counter()
+            self.solve(value)
+            end = time.perf_counter()
+            load_times.append(loaded - start)
+            solve_times.append(end - loaded)
+        return BenchResult(
+            self.day.get_date(),
+            self.title,
+            Timings(tuple(load_times)),
+            Timings(tuple(solve_times)),
+        )
 
 
 def part(
     title: int | str,
-) -> Callable[[Callable[[SELF, str], Any]], Callable[[SELF], Any]]:
+    *,
+    parser: Callable[[Any], Any] | str | None = None,
+    stream: bool = False,
+    buffer: bool = False,
+) -> Callable[[Callable[[SELF, Any], Any]], Callable[[SELF], Any]]:
     """A decorator to mark a function as a part of the challenge.
 
     Parameters
     ----------
     title: int | str
         The title of the part.
+    parser: Callable[[Any], Any] | str | None
+        If given, the function receives ``parser(input)`` instead of the raw input.
+        The parsed input is cached by the day, so parts using the same parser on the
+        same input only parse it once. A string names a method of the day to parse
+        with, for parsing that depends on the day's settings.
+    stream: bool
+        If true, the input is an iterator over its lines (see :meth:`Day.iter_input`)
+        instead of a string, so it can be consumed in constant memory.
+    buffer: bool
+        If true, the input is its raw bytes (see :meth:`Day.get_input_buffer`) instead
+        of a string, so it can be scanned without being decoded or copied.
 
     Returns
     -------
-    Callable[[Callable[[Day, str], Any]], Callable[[Day], Any]]
+    Callable[[Callable[[Day, Any], Any]], Callable[[Day], Any]]
         The decorator.
     """
+    mode = InputMode(parser, stream, buffer)
 
-    def decorator(func: Callable[[SELF, str], Any]) -> Callable[[SELF], Any]:
+    def decorator(func: Callable[[SELF, Any], Any]) -> Callable[[SELF], Any]:
         @functools.wraps(func)
         def wrapper(self: SELF) -> Any:
-            return func(self, self.get_input(title))
+            return Part(func, title, self, mode).call()
 
         # Ignore the type error here because we need to add this attribute
-        wrapper.__part__ = lambda self: Part(wrapper, title, self)  # type: ignore[attr-defined]
+        wrapper.__part__ = lambda self: Part(  # type: ignore[attr-defined]
+            func, title, self, mode
+        )
+        wrapper.__part_title__ = title  # type: ignore[attr-defined]
         return wrapper
 
     return decorator
+
+
+@functools.cache
+def day_registry() -> dict[int, str]:
+    """Map every day that has a solution to the module containing it. The days are
+    found from the file names in the ``days`` directory, so nothing is imported.
+    The returned dict is shared, and must not be modified.
+
+    Returns
+    -------
+    dict[int, str]
+        The day numbers, in ascending order, mapped to their module names.
+    """
+    days_dir = os.path.join(os.path.dirname(__file__), "days")
+    days = (
+        int(match.group(1))
+        for name in os.listdir(days_dir)
+        if (match := re.fullmatch(r"d(\d+)\.py", name))
+    )
+    return {day: f"aoc.days.d{day}" for day in sorted(days)}
+
+
+def available_days() -> list[int]:
+    """Get the days that have a solution, without importing them.
+
+    Returns
+    -------
+    list[int]
+        The day numbers, in ascending order.
+    """
+    return list(day_registry())
+
+
+def load_day(day: int) -> type[Day]:
+    """Import the solution for a day.
+
+    Parameters
+    ----------
+    day: int
+        The day to import.
+
+    Returns
+    -------
+    type[Day]
+        The :class:`Day` subclass for that day.
+    """
+    try:
+        module_name = day_registry()[day]
+    except KeyError:
+        raise ValueError(f"Could not find day {day}") from None
+    day_cls: type[Day] = getattr(importlib.import_module(module_name), f"Day{day}")
+    return day_cls
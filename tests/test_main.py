@@ -21,12 +21,30 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
+import asyncio
+import io
+import json
+import mmap
 import os
+import pstats
+import subprocess
+import sys
+from collections.abc import Generator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from unittest.mock import patch
 
 import pytest
 
-from aoc.utils import Day
+import aoc
+from aoc import __main__ as cli
+from aoc import bench
+from aoc.cache import ResultCache
+from aoc.days import d1, d2, d3, d4, d6, d7, d8
+from aoc.days.d4 import Day4
+from aoc.days.d6 import Day6
+from aoc.days.d7 import Day7
+from aoc.days.d8 import Day8
+from aoc.utils import Day, available_days, day_registry, load_day
 from aoc.utils import part as part_deco
 
 
@@ -116,3 +134,497 @@ def test_day():
     print_mock.assert_called_once_with(1)
     with pytest.raises(ValueError):
         day.run_part(3)
+
+
+def test_bench():
+    day = DayTest()
+    results = day.bench(repeat=5, warmup=2)
+    assert len(results) == 1
+    result = results[0]
+    assert result.part == 1
+    assert len(result.load.samples) == len(result.solve.samples) == 5
+    assert result.solve.min <= result.solve.median <= result.solve.p95
+    data = json.loads(bench.dumps(results))
+    assert data[0]["repeat"] == 5
+    assert set(data[0]["solve"]) == {"min", "median", "p95"}
+    with pytest.raises(ValueError):
+        day.part_1.bench(repeat=0)
+
+
+def test_bench_uncached(tmp_path):
+    calls = []
+
+    def parser(value: str) -> int:
+        calls.append(value)
+        return int(value)
+
+    class DayBench(Day):
+        @part_deco(1, parser=parser)
+        def part_1(self, value: int) -> int:
+            return value
+
+        @part_deco(2, stream=True)
+        def part_2(self, value):
+            assert not isinstance(value, Generator)
+            return sum(map(int, value))
+
+    (tmp_path / "bench.txt").write_text("12")
+    day = DayBench(input_path=str(tmp_path))
+    day.part_1.bench(repeat=3, warmup=0)
+    # Every timed run parses the input again
+    assert len(calls) == 3
+    day.part_2.bench(repeat=2, warmup=0)
+
+
+def test_input_cache(tmp_path):
+    calls = []
+
+    def parser(value: str) -> int:
+        calls.append(value)
+        return int(value)
+
+    class DayCache(Day):
+        @part_deco(1, parser=parser)
+        def part_1(self, value: int) -> int:
+            return value
+
+        @part_deco(2, parser=parser)
+        def part_2(self, value: int) -> int:
+            return value * 2
+
+    path = tmp_path / "cache.txt"
+    path.write_text("1")
+    day = DayCache(input_path=str(tmp_path))
+    assert day.run_part(1) == 1
+    assert day.run_part(2) == 2
+    assert calls == ["1"]
+    path.write_text("10")
+    assert day.run_part(1) == 10
+    assert calls == ["1", "10"]
+    day.clear_cache()
+    assert day.run_part(2) == 20
+    assert len(calls) == 3
+    day.clear_cache()
+    day.cache_size = 1
+    day.get_parsed(1, parser)
+    assert len(day._cache) == 1
+
+
+def test_run_all():
+    results = aoc.run_all(days=[1, 6], workers=2)
+    assert [(r.day, r.part, r.result) for r in results] == [
+        (1, 1, 69693),
+        (1, 2, 200945),
+        (6, 1, 1582),
+        (6, 2, 3588),
+    ]
+    assert all(r.succeeded and r.elapsed >= 0 for r in results)
+    with ThreadPoolExecutor() as executor:
+        results = aoc.run_all(days=[1], input_path="missing", executor=executor)
+    assert [r.part for r in results] == [1, 2]
+    assert all(
+        not r.succeeded and r.error.startswith("FileNotFoundError") for r in results
+    )
+
+
+def test_cli(capsys):
+    assert cli.main(["--day", "1", "--part", "2", "--example"]) == 0
+    out = capsys.readouterr().out.splitlines()
+    assert len(out) == 1
+    assert out[0].startswith("Day 1 part 2: 45000 (")
+    assert cli.main(["-d", "1", "-i", "missing"]) == 1
+    assert "FileNotFoundError" in capsys.readouterr().out
+    with pytest.raises(SystemExit):
+        cli.main(["-d", "0"])
+    with pytest.raises(SystemExit):
+        cli.main(["-d", "1", "-p", "3"])
+    assert "part 3 does not exist" in capsys.readouterr().err
+
+
+def test_registry():
+    assert available_days()[:8] == list(range(1, 9))
+    assert day_registry()[7] == "aoc.days.d7"
+    assert load_day(7).__name__ == "Day7"
+    with pytest.raises(ValueError):
+        load_day(0)
+
+    class DayChild(DayTest):
+        @part_deco("b")
+        def part_b(self, value: str) -> str:
+            return value
+
+        @part_deco("a")
+        def part_a(self, value: str) -> str:
+            return value
+
+    day = DayChild()
+    assert [func.title for func in day.parts()] == [1, "b", "a"]
+    assert day.run_part("a") == "a"
+    assert day.part_b is day.parts()[1]
+
+
+def test_stream(tmp_path):
+    seen = []
+
+    class DayStream(Day):
+        @part_deco(1, stream=True)
+        def part_1(self, value):
+            seen.append(value)
+            return next(value)
+
+        @part_deco(2, stream=True, parser=list)
+        def part_2(self, value: list[str]) -> list[str]:
+            return value
+
+    (tmp_path / "stream.txt").write_text("a\nb\r\n\nc")
+    day = DayStream(input_path=str(tmp_path))
+    assert day.run_part(1) == "a"
+    # The generator is closed after the part returns, even if it wasn't exhausted
+    assert list(seen[0]) == []
+    assert day.run_part(2) == ["a", "b", "", "c"]
+
+
+def test_buffer(tmp_path):
+    seen = []
+
+    class DayBuffer(Day):
+        mmap_threshold = 4
+
+        @part_deco(1, buffer=True)
+        def part_1(self, value):
+            seen.append(value)
+            return value[:5]
+
+    (tmp_path / "buffer.txt").write_bytes(b"abcde\n")
+    day = DayBuffer(input_path=str(tmp_path))
+    assert day.run_part(1) == b"abcde"
+    assert isinstance(seen[0], mmap.mmap) and seen[0].closed
+    day.mmap_threshold = 1 << 16
+    assert day.run_part(1) == b"abcde"
+    assert seen[1] == b"abcde\n"
+    with pytest.raises(ValueError):
+        part_deco(1, stream=True, buffer=True)
+
+
+def test_result_cache(tmp_path):
+    calls = []
+
+    class DayCached(Day):
+        @part_deco(1)
+        def part_1(self, value: str) -> int:
+            calls.append(value)
+            return int(value)
+
+        @part_deco(2)
+        def part_2(self, value: str) -> tuple[int]:
+            calls.append(value)
+            return (int(value),)
+
+    path = tmp_path / "cached.txt"
+    path.write_text("1")
+    cache = ResultCache(str(tmp_path / "results.db"), max_entries=2)
+    day = DayCached(input_path=str(tmp_path), result_cache=cache)
+    assert day.run_part(1) == 1
+    assert DayCached(str(tmp_path), cache).run_part(1) == 1
+    assert calls == ["1"]
+    # Results that don't survive JSON aren't cached
+    assert day.run_part(2) == (1,)
+    assert day.run_part(2) == (1,)
+    assert len(calls) == 3
+    path.write_text("22")
+    assert day.run_part(1) == 22
+    path.write_text("333")
+    assert day.run_part(1) == 333
+    assert len(cache) == 2
+    cache.clear()
+    assert len(cache) == 0
+    cache.close()
+
+
+def test_result_cache_config(tmp_path):
+    (tmp_path / "3.txt").write_text("ax\nay\naz\nzb\nbq\nbr\n")
+    cache = ResultCache(str(tmp_path / "results.db"))
+    day = d3.Day3(input_path=str(tmp_path), result_cache=cache)
+    assert day.run_part(2) == 1 + 2
+    day.group_size = 2
+    assert day.run_part(2) == 1 + 26 + 2
+    # Settings the parts don't read don't change the key
+    day = d1.Day1(input_path=os.path.join("inputs", "examples"), result_cache=cache)
+    key = cache.key(day.part_1)
+    day.k, day.workers = 5, 2
+    assert cache.key(day.part_1) == key
+    cache.close()
+
+
+def test_instrumentation(tmp_path, capsys):
+    day = DayTest()
+    records = []
+    profile = tmp_path / "day.pstats"
+    assert day.part_1.call(str(profile), True, records.append) == 1
+    assert pstats.Stats(str(profile)).total_calls > 0
+    assert records[0].part == 1 and records[0].result == 1
+    assert records[0].elapsed >= 0 and records[0].peak_memory >= 0
+    day.run(str(tmp_path), True, records.append)
+    assert (tmp_path / f"day{day.get_date()}_part1.pstats").exists()
+    assert len(records) == 2
+    assert "peak memory" in capsys.readouterr().out
+    assert (
+        cli.main(["-d", "1", "-e", "--profile", str(tmp_path), "--trace-memory"]) == 0
+    )
+    assert (tmp_path / "day1_part2.pstats").exists()
+    assert "peak memory" in capsys.readouterr().out
+
+
+def test_async():
+    day = load_day(1)(input_path=os.path.join("inputs", "examples"))
+    assert asyncio.run(day.arun_part(2)) == 45000
+    assert asyncio.run(day.arun()) == [24000, 45000]
+    with pytest.raises(ValueError):
+        asyncio.run(day.arun_part(3))
+    with ProcessPoolExecutor(1) as executor:
+        assert asyncio.run(day.arun_part(1, executor)) == 24000
+    results = asyncio.run(aoc.arun_all(days=[1, 6], limit=1))
+    assert [r.result for r in results] == [69693, 200945, 1582, 3588]
+    results = asyncio.run(aoc.arun_all(days=[2], input_path="missing"))
+    assert all(not r.succeeded for r in results)
+
+
+def test_async_config_and_cache():
+    day = d3.Day3(input_path=os.path.join("inputs", "examples"))
+    day.group_size = 2
+    with ProcessPoolExecutor(1) as executor:
+        assert asyncio.run(day.arun_part(2, executor)) == day.run_part(2)
+    calls = []
+
+    def parser(value: str) -> str:
+        calls.append(value)
+        return value
+
+    class DayShared(Day):
+        _date = 1
+
+        @part_deco(1, parser=parser)
+        def part_1(self, value: str) -> str:
+            return value
+
+        @part_deco(2, parser=parser)
+        def part_2(self, value: str) -> str:
+            return value
+
+    for _ in range(20):
+        day = DayShared(input_path=os.path.join("inputs", "examples"))
+        asyncio.run(day.arun())
+    # Parts running at once share a single parse
+    assert len(calls) == 20
+
+
+def test_d7_filesystems():
+    examples = Day7(input_path=os.path.join("inputs", "examples"))
+    with ThreadPoolExecutor(2) as executor:
+        first, second = executor.map(
+            d7.parse_input, [Day7().iter_input(1), examples.iter_input(1)]
+        )
+    assert first.get_sum() == 1141028
+    assert second.get_sum() == 95437
+    assert second.root.size == 48381165
+    assert second.root.cd("a").cd("e").size == 584
+    assert not hasattr(second.root, "__dict__")
+
+
+def test_d7_incremental():
+    lines = list(Day7(os.path.join("inputs", "examples")).iter_input(1))
+    for split in range(len(lines) + 1):
+        filesystem = d7.parse_input(lines[:split])
+        filesystem.get_sum()
+        filesystem.feed(lines[split:])
+        assert filesystem.get_sum() == 95437
+        assert filesystem.free_space(30000000) == 24933642
+    filesystem = d7.parse_input(["$ cd /", "$ ls", "100 a.txt", "dir b"])
+    filesystem.feed(["$ ls", "150 a.txt", "dir b", "$ cd b", "$ ls", "5 c.txt"])
+    assert filesystem.root.size == 155
+    assert list(filesystem.root.children) == ["a.txt", "b"]
+
+
+def test_d7_concurrent(tmp_path):
+    lines = ["$ cd /"]
+    for index in range(2000):
+        lines += [f"$ cd d{index}", "$ ls", f"{index} f.txt", "dir x"]
+    (tmp_path / "7.txt").write_text("\n".join(lines))
+    day = Day7(input_path=str(tmp_path))
+    expected = [day.run_part(1), day.run_part(2)]
+    for _ in range(20):
+        day = Day7(input_path=str(tmp_path))
+        day.get_parsed(1, d7.parse_input, stream=True)
+        assert asyncio.run(day.arun()) == expected
+
+
+@pytest.mark.parametrize("engine", d8.ENGINES)
+def test_d8_engines(engine, example, monkeypatch):
+    if engine == "numpy":
+        pytest.importorskip("numpy")
+    elif engine == "python":
+        # Without NumPy, the auto engine falls back to pure Python
+        monkeypatch.setattr(d8, "np", None)
+        engine = "auto"
+    day = Day8(os.path.join("inputs", "examples") if example else "inputs")
+    day.engine = engine
+    assert (day.run_part(1), day.run_part(2)) == (
+        (21, 8) if example else (1543, 595080)
+    )
+    for grid in (
+        b"30373\r\n25512\r\n65332\r\n33549\r\n35390",
+        b"30373\n25512\n65332\n33549\n35390\n\n",
+        b"30373\r\n25512\r\n65332\r\n33549\r\n35390\r\n\r\n",
+    ):
+        assert day.logic(grid) == 21
+        assert day.logic(grid, part2=True) == 8
+    assert day.logic(b"") == day.logic(b"\n", part2=True) == 0
+
+
+def test_d8_shared_analysis(monkeypatch):
+    calls = []
+
+    def engine(value):
+        calls.append(value)
+        return d8.stack_logic(value)
+
+    monkeypatch.setitem(d8.ENGINES, "counted", engine)
+    day = Day8(os.path.join("inputs", "examples"))
+    day.engine = "counted"
+    assert day.run_part(1) == 21
+    assert day.run_part(2) == 8
+    assert len(calls) == 1
+
+
+def test_d8_ragged_grid():
+    pytest.importorskip("numpy")
+    for grid in (b"303\n25512\n65332", b"30373\n2551\n653321\n"):
+        with pytest.raises(ValueError):
+            d8.numpy_logic(grid)
+
+
+def test_d6_large_window():
+    signal = bytes(range(256)) * 4
+    assert d6.logic(b"a" + signal, 256) == 257
+    assert d6.logic(b"abcabcd", 4) == 7
+    with pytest.raises(ValueError):
+        d6.logic(b"abcabc", 4)
+
+
+def test_d6_stream():
+    day = Day6()
+    signal = day.get_input_buffer(1)
+    chunks = [signal[i : i + 7] for i in range(0, len(signal), 7)]
+    assert dict(day.markers(chunks)) == {4: 1582, 14: 3588}
+    assert dict(day.markers(io.BytesIO(signal), [14])) == {14: 3588}
+    stream = b"abcabcdab"
+    expected = [
+        (size, end)
+        for end in range(1, len(stream) + 1)
+        for size in (3, 4)
+        if size <= end and len(set(stream[end - size : end])) == size
+    ]
+    assert (
+        list(d6.scan_markers(iter(stream[i : i + 1] for i in range(9)), (4, 3), True))
+        == expected
+    )
+    with pytest.raises(ValueError):
+        d6.MarkerScanner([257])
+
+
+@pytest.mark.parametrize("bitmask", [False, True])
+def test_d3_groups(bitmask):
+    lines = [b"abcX", b"defX", b"Xghi", b"aZ", b"bZc", b"ZZ", b"Zd"]
+    assert d3.item_mask(b"ac") == 0b101
+    assert d3.compartment_priorities([b"aBcB", b"zz"], bitmask) == 28 + 26
+    assert d3.group_priorities(lines, 3, bitmask) == 50 + 52 + 52
+    assert d3.group_priorities(lines[3:], 4, bitmask) == 52
+    assert d3.group_priorities(lines[:3], 2, bitmask) == 50 + 50
+    # With several common items, the bitmasks find the highest priority, and a scan
+    # the first in the first rucksack
+    assert d3.group_priorities(lines[:2], 1, bitmask) == (100 if bitmask else 1 + 4)
+
+
+def test_d4_wide_ranges():
+    day = Day4()
+    sections = d4.parse_input(["0-1000000000,5-6", "1-2,3-1000000000000", ""])
+    assert list(sections[:4]) == [0, 1000000000, 5, 6]
+    assert day.part_1.solve(sections) == 1
+    assert day.part_2.solve(sections) == 1
+    for line in ("5-6,7", "1-2,3-4,5-6", "1,2,3,4", "1-2-3-4", "5-3,1-2"):
+        with pytest.raises(ValueError):
+            d4.parse_input(["1-2,3-4", line])
+
+
+def test_d4_coverage():
+    coverage = d4.Coverage(
+        d4.parse_input(
+            ["2-4,6-8", "2-3,4-5", "5-7,7-9", "2-8,3-7", "6-6,4-6", "2-6,4-8"]
+        )
+    )
+    assert coverage.depth(1) == 0
+    assert coverage.depth(4) == 7
+    assert coverage.max_depth() == 8
+    assert coverage.covered(6) == [(4, 6)]
+    assert coverage.covered(0) == [(2, 9)]
+    pairs = set(coverage.overlapping())
+    naive = {
+        (i, j)
+        for i in range(12)
+        for j in range(i + 1, 12)
+        if coverage.sections[2 * i] <= coverage.sections[2 * j + 1]
+        and coverage.sections[2 * j] <= coverage.sections[2 * i + 1]
+    }
+    assert pairs == naive
+    assert Day4().coverage().max_depth() >= 1
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 1 << 20])
+def test_d2_counts(chunk_size):
+    value = b"A Y\nB X\r\nC Z\n" * 3 + b"A X"
+    counts = d2.count_rounds(value, chunk_size)
+    assert sum(counts) == 10
+    assert d2.logic(counts) == 15 * 3 + 4
+    assert d2.logic(counts, True) == 12 * 3 + 3
+
+
+def test_d1_top_k(tmp_path):
+    lines = "1000\n2000\n3000\n\n4000\n\n5000\n6000\n\n7000\n8000\n9000\n\n10000".splitlines()
+    assert d1.top_k(lines) == [24000, 11000, 10000]
+    assert d1.top_k(lines, 10) == sorted(d1.parse_input(lines), reverse=True)
+    with pytest.raises(ValueError):
+        d1.top_k(lines, 0)
+    (tmp_path / "1.txt").write_text("\n".join(lines))
+    day = d1.Day1(input_path=str(tmp_path))
+    assert day.run_part(1) == 24000
+    assert day.run_part(2) == 45000
+    day.k = 2
+    assert day.top() == [24000, 11000]
+
+
+def test_d1_parallel(tmp_path):
+    text = "1\n2\n\n3\r\n\r\n\n" + "4\n" * 50 + "\n5\n6\n\n7" + "\n\n8\n9" * 20 + "\n"
+    lines = text.replace("\r", "").split("\n")[:-1]
+    path = tmp_path / "1.txt"
+    path.write_text(text, newline="")
+    value = path.read_bytes()
+    for chunks in (1, 3, 7, len(value)):
+        ranges = d1.group_ranges(value, chunks)
+        assert ranges[0][0] == 0 and ranges[-1][1] == len(value)
+        assert all(value[stop - 1 : stop] == b"\n" for _, stop in ranges)
+    for k in (1, 3, 100):
+        assert d1.parallel_top_k(str(path), k, 4) == d1.top_k(lines, k)
+    (tmp_path / "empty.txt").write_text("")
+    assert d1.parallel_top_k(str(tmp_path / "empty.txt"), 3, 4) == [0]
+    day = d1.Day1(input_path=str(tmp_path))
+    day.workers = 4
+    assert day.top() == [200, 17, 17]
+
+
+def test_lazy_import():
+    code = "import sys, aoc; assert 'aoc.runner' not in sys.modules; aoc.run_all; assert 'aoc.runner' in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)
+    code = "import sys, aoc.__main__, aoc.days.d6; assert not {'asyncio', 'aoc.cache'} & set(sys.modules)"
+    subprocess.run([sys.executable, "-c", code], check=True)
+    with pytest.raises(AttributeError):
+        aoc.missing